@@ -7,6 +7,14 @@ audio analysis and stem separation.
 
 __version__ = "0.1.0"
 
-from .pipeline import MusicProfanityFilter
-
 __all__ = ["MusicProfanityFilter"]
+
+
+def __getattr__(name: str):
+    # Imported lazily so `import music_profanity_filter` (and the CLI's --help)
+    # doesn't pay for loading torch, Demucs and Whisper up front
+    if name == "MusicProfanityFilter":
+        from .pipeline import MusicProfanityFilter
+
+        return MusicProfanityFilter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
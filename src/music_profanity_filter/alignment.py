@@ -0,0 +1,142 @@
+"""
+Word sequence alignment.
+
+Aligns transcribed words against reference lyrics.
+"""
+
+from difflib import SequenceMatcher
+
+import numpy as np
+
+try:
+    from rapidfuzz.distance import Levenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Edit operations emitted by _edit_ops
+_EQUAL, _REPLACE, _DELETE, _INSERT = 0, 1, 2, 3
+
+
+def _edit_ops(source: np.ndarray, target: np.ndarray) -> np.ndarray:
+    """
+    Find a minimal Levenshtein edit path between two integer sequences.
+
+    Plain loops over NumPy arrays, so Numba can compile it to machine code.
+
+    Returns:
+        Array with one operation (_EQUAL, _REPLACE, _DELETE or _INSERT) per
+        step of the path, from the start of both sequences
+    """
+    n = len(source)
+    m = len(target)
+    dist = np.empty((n + 1, m + 1), dtype=np.int32)
+    for i in range(n + 1):
+        dist[i, 0] = i
+    for j in range(m + 1):
+        dist[0, j] = j
+    for i in range(1, n + 1):
+        for j in range(1, m + 1):
+            cost = 0 if source[i - 1] == target[j - 1] else 1
+            dist[i, j] = min(dist[i - 1, j - 1] + cost, dist[i - 1, j] + 1, dist[i, j - 1] + 1)
+
+    # Trace back from the end, preferring matches, then substitutions
+    ops = np.empty(n + m, dtype=np.int8)
+    k = 0
+    i = n
+    j = m
+    while i > 0 or j > 0:
+        if i > 0 and j > 0 and source[i - 1] == target[j - 1] and dist[i, j] == dist[i - 1, j - 1]:
+            ops[k] = _EQUAL
+            i -= 1
+            j -= 1
+        elif i > 0 and j > 0 and dist[i, j] == dist[i - 1, j - 1] + 1:
+            ops[k] = _REPLACE
+            i -= 1
+            j -= 1
+        elif i > 0 and dist[i, j] == dist[i - 1, j] + 1:
+            ops[k] = _DELETE
+            i -= 1
+        else:
+            ops[k] = _INSERT
+            j -= 1
+        k += 1
+    return ops[:k][::-1]
+
+
+if NUMBA_AVAILABLE:
+    # nogil so alignment can overlap with other work on another thread
+    _edit_ops = njit(cache=True, nogil=True)(_edit_ops)
+
+
+def _opcodes_from_ops(ops: list[int]) -> list[tuple[str, int, int, int, int]]:
+    """Group an edit path into SequenceMatcher-style opcodes."""
+    opcodes = []
+    i = j = 0  # Start of the current block in source / target
+    di = dj = 0  # Length of the current block in source / target
+    block_equal = None
+    for op in ops:
+        is_equal = op == _EQUAL
+        if block_equal is not None and is_equal != block_equal:
+            opcodes.append(_opcode(block_equal, i, di, j, dj))
+            i += di
+            j += dj
+            di = dj = 0
+        block_equal = is_equal
+        if op != _INSERT:
+            di += 1
+        if op != _DELETE:
+            dj += 1
+    if block_equal is not None:
+        opcodes.append(_opcode(block_equal, i, di, j, dj))
+    return opcodes
+
+
+def _opcode(equal: bool, i: int, di: int, j: int, dj: int) -> tuple[str, int, int, int, int]:
+    """Build one opcode for a block of source[i:i + di] and target[j:j + dj]."""
+    if equal:
+        tag = "equal"
+    elif di and dj:
+        tag = "replace"
+    elif di:
+        tag = "delete"
+    else:
+        tag = "insert"
+    return tag, i, i + di, j, j + dj
+
+
+def align_words(source: list[str], target: list[str]) -> list[tuple[str, int, int, int, int]]:
+    """
+    Compute the edit operations that turn one word sequence into another.
+
+    Uses rapidfuzz's C implementation of Levenshtein alignment when installed,
+    then a Numba-compiled Levenshtein alignment, and otherwise difflib's
+    SequenceMatcher. Words are mapped to integer ids first so the comparison
+    works on ints rather than strings.
+
+    Args:
+        source: Normalized words to align from (e.g. the transcription)
+        target: Normalized words to align to (e.g. reference lyrics)
+
+    Returns:
+        List of (tag, i1, i2, j1, j2) tuples in the same form as
+        SequenceMatcher.get_opcodes(); tag is one of "equal", "replace",
+        "insert" or "delete"
+    """
+    if not (RAPIDFUZZ_AVAILABLE or NUMBA_AVAILABLE):
+        return SequenceMatcher(None, source, target).get_opcodes()
+
+    ids: dict[str, int] = {}
+    source_ids = [ids.setdefault(word, len(ids)) for word in source]
+    target_ids = [ids.setdefault(word, len(ids)) for word in target]
+    if RAPIDFUZZ_AVAILABLE:
+        return Levenshtein.opcodes(source_ids, target_ids).as_list()
+
+    ops = _edit_ops(np.array(source_ids, dtype=np.int32), np.array(target_ids, dtype=np.int32))
+    return _opcodes_from_ops(ops.tolist())
@@ -2,17 +2,17 @@
 Command-line interface for the music profanity filter.
 """
 
+import asyncio
 import os
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 import click
-from dotenv import load_dotenv
 
-from .pipeline import MusicProfanityFilter
-
-# Load .env file if present
-load_dotenv()
+# Most Genius lookups --concurrent-lyrics runs at once; more invites rate limiting
+LYRICS_FETCH_WORKERS = 4
 
 
 def format_time(seconds: float) -> str:
@@ -33,6 +33,49 @@ def print_profanities(profanities) -> None:
     click.echo(f"Total: {len(profanities)} profanities found\n")
 
 
+def prefetch_lyrics(lyrics_fetcher, input_files) -> dict[Path, Future]:
+    """
+    Start fetching lyrics for every file concurrently.
+
+    The lookups run on an asyncio loop in a background thread, so network
+    latency overlaps with processing of the first files. The loop's executor
+    is capped at LYRICS_FETCH_WORKERS threads, so only that many requests
+    reach Genius at a time.
+    """
+    loop = asyncio.new_event_loop()
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=LYRICS_FETCH_WORKERS, thread_name_prefix="lyrics")
+    )
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return {
+        input_path: asyncio.run_coroutine_threadsafe(
+            lyrics_fetcher.fetch_from_file_async(input_path), loop
+        )
+        for input_path in input_files
+    }
+
+
+def report_filter_result(result) -> None:
+    """Print the outcome of filtering a single file."""
+    skipped = len(result.profanities_skipped)
+    if not result.success:
+        click.secho(f"Error: {result.error}", fg="red")
+    elif result.profanities_found:
+        click.secho(
+            f"Cleaned {len(result.profanities_found)} profanities -> {result.output_path}",
+            fg="green",
+        )
+        if skipped:
+            click.secho(f"Skipped {skipped} zero-length matches.", fg="yellow")
+    elif skipped:
+        click.secho(
+            f"Skipped {skipped} zero-length matches, original audio kept -> {result.output_path}",
+            fg="yellow",
+        )
+    else:
+        click.secho("No profanity found, file unchanged.", fg="yellow")
+
+
 @click.command()
 @click.argument("input_files", nargs=-1, type=click.Path(exists=True, path_type=Path))
 @click.option(
@@ -67,6 +110,30 @@ def print_profanities(profanities) -> None:
     default="htdemucs",
     help="Demucs model for stem separation.",
 )
+@click.option(
+    "--device",
+    type=click.Choice(["auto", "cuda", "mps", "cpu"]),
+    default="auto",
+    help="Compute device for Demucs and Whisper. 'auto' uses a GPU when available.",
+)
+@click.option(
+    "--compute-type",
+    default="auto",
+    help="Whisper compute type (int8, int8_float16, float16, float32). "
+    "'auto' uses int8_float16 on CUDA and int8 on CPU.",
+)
+@click.option(
+    "--encoder-preset",
+    type=click.Choice(["fast", "medium", "high"]),
+    default=None,
+    help="MP3 encoder speed/quality trade-off. Defaults to the encoder's own setting.",
+)
+@click.option(
+    "--fast",
+    is_flag=True,
+    help="Write only the vocals stem and mute the original mix instead of "
+    "recombining stems (instrumentals dip too).",
+)
 @click.option(
     "--keep-temp",
     is_flag=True,
@@ -99,6 +166,11 @@ def print_profanities(profanities) -> None:
     is_flag=True,
     help="Automatically fetch lyrics from Genius (requires GENIUS_ACCESS_TOKEN).",
 )
+@click.option(
+    "--concurrent-lyrics",
+    is_flag=True,
+    help="Fetch lyrics for all files up front, a few at a time (log output may interleave).",
+)
 @click.option(
     "--genius-token",
     envvar="GENIUS_ACCESS_TOKEN",
@@ -112,12 +184,17 @@ def main(
     profanity_list: Path | None,
     whisper_model: str,
     demucs_model: str,
+    device: str,
+    compute_type: str,
+    encoder_preset: str | None,
+    fast: bool,
     keep_temp: bool,
     detect_only: bool,
     generate_edl: bool,
     apply_edl: str | None,
     lyrics: Path | None,
     fetch_lyrics: bool,
+    concurrent_lyrics: bool,
     genius_token: str | None,
 ):
     """
@@ -148,6 +225,14 @@ def main(
         click.echo("No input files specified. Use --help for usage information.")
         sys.exit(1)
 
+    # Deferred so --help and argument errors don't import torch/Demucs/Whisper
+    from dotenv import load_dotenv
+
+    from .pipeline import MusicProfanityFilter
+
+    # Load .env file if present
+    load_dotenv()
+
     # Initialize the filter
     click.echo("Initializing music profanity filter...")
     filter_instance = MusicProfanityFilter(
@@ -155,7 +240,12 @@ def main(
         whisper_model=whisper_model,
         profanity_list_path=profanity_list,
         keep_temp_files=keep_temp,
+        device=device,
+        compute_type=compute_type,
+        fast_mode=fast,
     )
+    # Stop its background threads once the command finishes
+    click.get_current_context().call_on_close(filter_instance.close)
 
     # Initialize lyrics fetcher if needed
     lyrics_fetcher = None
@@ -174,20 +264,62 @@ def main(
         shared_lyrics_text = lyrics.read_text(encoding="utf-8")
         click.echo(f"Loaded lyrics from {lyrics}")
 
-    # Process each file
-    results = []
-    for input_path in input_files:
-        click.echo(f"\n{'=' * 60}")
-        click.echo(f"Processing: {input_path}")
-        click.echo("=" * 60)
+    # Optionally kick off every Genius lookup now instead of one per file
+    lyrics_futures = {}
+    if concurrent_lyrics and lyrics_fetcher and not shared_lyrics_text:
+        lyrics_futures = prefetch_lyrics(lyrics_fetcher, input_files)
 
-        # Determine lyrics for this file
+    # In detect-only mode, separate and transcribe all files up front
+    batch_profanities = {}
+    if detect_only and len(input_files) > 1:
+        batch_profanities = dict(
+            zip(input_files, filter_instance.detect_only_batch(list(input_files)))
+        )
+
+    def lyrics_for_file(input_path: Path) -> str | None:
+        """Return the lyrics to use for a file."""
         lyrics_text = shared_lyrics_text
-        if not lyrics_text and lyrics_fetcher:
+        if input_path in lyrics_futures:
+            lyrics_text = lyrics_futures[input_path].result()
+        elif not lyrics_text and lyrics_fetcher:
             # Try to fetch lyrics from Genius
             fetched = lyrics_fetcher.fetch_from_file(input_path)
             if fetched:
                 lyrics_text = fetched
+        return lyrics_text
+
+    def begin_file(input_path: Path) -> str | None:
+        """Print the header for a file and return the lyrics to use for it."""
+        click.echo(f"\n{'=' * 60}")
+        click.echo(f"Processing: {input_path}")
+        click.echo("=" * 60)
+        return lyrics_for_file(input_path)
+
+    # Plain multi-file cleaning: separate the next file while this one is
+    # transcribed, and encode each in the background
+    results = []
+    sequential_files = input_files
+    if len(input_files) > 1 and not (detect_only or apply_edl or generate_edl or preview):
+        results = filter_instance.filter_batch(
+            list(input_files),
+            output_dir=output_dir,
+            overwrite=overwrite,
+            lyrics_for=lyrics_for_file,
+            encoder_preset=encoder_preset,
+        )
+        for result in results:
+            click.echo(f"\n{result.input_path}:")
+            if result.profanities_found:
+                print_profanities(result.profanities_found)
+            report_filter_result(result)
+        sequential_files = ()
+
+    # An explicit EDL path is the same for every file, so resolve it once
+    explicit_edl_path = Path(apply_edl) if apply_edl and apply_edl != "__AUTO__" else None
+
+    # Process each file
+    for input_path in sequential_files:
+        lyrics_text = begin_file(input_path)
 
         # Determine output path
         if output_dir:
@@ -197,7 +329,11 @@ def main(
 
         if detect_only:
             # Just detect and report
-            profanities = filter_instance.detect_only(input_path)
+            if input_path in batch_profanities:
+                profanities = batch_profanities[input_path]
+            else:
+                profanities = filter_instance.detect_only(input_path)
+
             if profanities:
                 print_profanities(profanities)
             else:
@@ -206,10 +342,10 @@ def main(
 
         if apply_edl:
             # Resolve EDL path (use default if "__AUTO__")
-            if apply_edl == "__AUTO__":
+            if explicit_edl_path is None:
                 edl_path = input_path.parent / f"{input_path.stem}.edl.json"
             else:
-                edl_path = Path(apply_edl)
+                edl_path = explicit_edl_path
 
             if not edl_path.exists():
                 click.secho(f"Error: EDL file not found: {edl_path}", fg="red")
@@ -221,6 +357,7 @@ def main(
                 edl_path=edl_path,
                 output_path=output_path,
                 overwrite=overwrite,
+                encoder_preset=encoder_preset,
             )
             results.append(result)
 
@@ -248,7 +385,8 @@ def main(
             elif result.profanities_found:
                 print_profanities(result.profanities_found)
                 click.secho(f"EDL saved to: {result.edl_path}", fg="green")
-                click.secho(f"Stems saved to: {result.stems_dir}", fg="green")
+                if result.stems_dir:
+                    click.secho(f"Stems saved to: {result.stems_dir}", fg="green")
             else:
                 click.secho("No profanity found, no EDL generated.", fg="yellow")
             continue
@@ -267,18 +405,10 @@ def main(
             overwrite=overwrite,
             preview_callback=preview_callback,
             lyrics=lyrics_text,
+            encoder_preset=encoder_preset,
         )
         results.append(result)
-
-        if not result.success:
-            click.secho(f"Error: {result.error}", fg="red")
-        elif result.profanities_found:
-            click.secho(
-                f"Cleaned {len(result.profanities_found)} profanities -> {result.output_path}",
-                fg="green",
-            )
-        else:
-            click.secho("No profanity found, file unchanged.", fg="yellow")
+        report_filter_result(result)
 
     # Summary
     if len(input_files) > 1 and not detect_only:
@@ -5,11 +5,43 @@ Identifies profane words in transcribed text using a configurable word list.
 """
 
 import re
+from bisect import bisect_right
 from dataclasses import dataclass
 from pathlib import Path
 
 from .transcriber import TranscribedWord
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+_WORD_RE = re.compile(r"\w+")
+
+# Minimal fallback word list. This is intentionally minimal - users should
+# provide their own list for comprehensive filtering
+_DEFAULT_PROFANITIES = frozenset({
+    "fuck", "fucking", "fucked", "fucker", "fuckin",
+    "shit", "shitty", "bullshit",
+    "ass", "asshole", "asses",
+    "bitch", "bitches", "bitching",
+    "damn", "damned", "goddamn",
+    "hell",
+    "crap",
+    "dick", "dicks",
+    "cock", "cocks",
+    "pussy", "pussies",
+    "cunt", "cunts",
+    "whore", "whores",
+    "slut", "sluts",
+    "bastard", "bastards",
+    "piss", "pissed", "pissing",
+})
+
+# Shortest profanity that counts when found inside a longer word
+_MIN_CONTAINED_LEN = 4
+
 
 @dataclass
 class ProfanityMatch:
@@ -37,6 +69,9 @@ class ProfanityDetector:
                            If None, uses the built-in default list.
         """
         self.profanity_set: set[str] = set()
+        self._automaton = None
+        self._regex: re.Pattern | None = None
+        self._by_len: dict[int, list[str]] = {}
         self._load_word_list(word_list_path)
 
     def _load_word_list(self, word_list_path: Path | None = None) -> None:
@@ -49,6 +84,7 @@ class ProfanityDetector:
             else:
                 # Fallback to a minimal built-in list
                 self.profanity_set = self._get_default_words()
+                self._build_matcher()
                 return
 
         word_list_path = Path(word_list_path)
@@ -61,35 +97,103 @@ class ProfanityDetector:
                 if word and not word.startswith("#"):  # Skip empty lines and comments
                     self.profanity_set.add(word)
 
+        self._build_matcher()
         print(f"Loaded {len(self.profanity_set)} profanity words")
 
+    def _build_matcher(self) -> None:
+        """
+        Build the multi-pattern matcher used for substring detection.
+
+        Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise
+        a single compiled alternation regex (longest patterns first). Either is
+        built once per word list and reused for every transcript.
+
+        Profanities are also bucketed by length. Only those long enough to
+        count inside another word go into the matcher; shorter ones can only
+        match exactly, which the profanity set already handles.
+        """
+        self._automaton = None
+        self._regex = None
+        self._by_len = {}
+        for word in self.profanity_set:
+            self._by_len.setdefault(len(word), []).append(word)
+
+        lengths = [n for n in sorted(self._by_len, reverse=True) if n >= _MIN_CONTAINED_LEN]
+        if not lengths:
+            return
+
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for length in lengths:
+                for word in self._by_len[length]:
+                    automaton.add_word(word, (length, word))
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            patterns = (re.escape(w) for n in lengths for w in self._by_len[n])
+            self._regex = re.compile("|".join(patterns))
+
+    def _iter_contained(self, text: str):
+        """Yield (start, end, profanity) for each profanity (4+ chars) found in text."""
+        if self._automaton is not None:
+            for end_idx, (length, profanity) in self._automaton.iter(text):
+                if length >= _MIN_CONTAINED_LEN:
+                    yield end_idx - length + 1, end_idx + 1, profanity
+        elif self._regex is not None:
+            for m in self._regex.finditer(text):
+                yield m.start(), m.end(), m.group()
+
+    def _match_words(self, normalized_words: list[str]) -> list[str | None]:
+        """
+        Find the profanity matched by each normalized word, if any.
+
+        Exact matches are resolved with a set lookup. The remaining words are
+        joined into one string and scanned in a single pass, with match offsets
+        mapped back to their word via binary search.
+
+        Args:
+            normalized_words: Words already passed through transcriber.normalize_word
+
+        Returns:
+            List parallel to normalized_words with the matched profanity or None
+        """
+        results: list[str | None] = [None] * len(normalized_words)
+
+        # Words that aren't exact matches, and where each starts in the joined text
+        pending: list[int] = []
+        starts: list[int] = []
+        parts: list[str] = []
+        cursor = 0
+        for i, normalized in enumerate(normalized_words):
+            if normalized in self.profanity_set:
+                results[i] = normalized
+                continue
+            # Too short to contain any profanity that counts as a substring
+            if len(normalized) < _MIN_CONTAINED_LEN:
+                continue
+            pending.append(i)
+            starts.append(cursor)
+            parts.append(normalized)
+            cursor += len(normalized) + 1
+
+        if not parts:
+            return results
+
+        # Check if any profanity word is contained within a word
+        # (handles cases like "motherfucker" containing "fuck")
+        for start, end, profanity in self._iter_contained(" ".join(parts)):
+            pos = bisect_right(starts, start) - 1
+            idx = pending[pos]
+            # Skip matches spanning two words (multi-word patterns in custom lists)
+            if results[idx] is None and end <= starts[pos] + len(parts[pos]):
+                results[idx] = profanity
+
+        return results
+
     def _get_default_words(self) -> set[str]:
         """Return a minimal default profanity word list."""
-        # This is intentionally minimal - users should provide their own list
-        # for comprehensive filtering
-        return {
-            "fuck", "fucking", "fucked", "fucker", "fuckin",
-            "shit", "shitty", "bullshit",
-            "ass", "asshole", "asses",
-            "bitch", "bitches", "bitching",
-            "damn", "damned", "goddamn",
-            "hell",
-            "crap",
-            "dick", "dicks",
-            "cock", "cocks",
-            "pussy", "pussies",
-            "cunt", "cunts",
-            "whore", "whores",
-            "slut", "sluts",
-            "bastard", "bastards",
-            "piss", "pissed", "pissing",
-        }
-
-    def _normalize_word(self, word: str) -> str:
-        """Normalize a word for matching."""
-        # Remove punctuation and convert to lowercase
-        normalized = re.sub(r"[^\w]", "", word.lower())
-        return normalized
+        # Copy, since add_words/remove_words mutate the detector's set
+        return set(_DEFAULT_PROFANITIES)
 
     def detect(self, words: list[TranscribedWord]) -> list[ProfanityMatch]:
         """
@@ -102,37 +206,20 @@ class ProfanityDetector:
             List of ProfanityMatch objects for detected profanities
         """
         matches = []
+        # Normalized once when each word was created
+        normalized_words = [word.normalized for word in words]
 
-        for word in words:
-            normalized = self._normalize_word(word.word)
-
-            # Check exact match
-            if normalized in self.profanity_set:
+        for word, profanity in zip(words, self._match_words(normalized_words)):
+            if profanity:
                 matches.append(
                     ProfanityMatch(
-                        word=normalized,
+                        word=profanity,
                         original_word=word.word,
                         start=word.start,
                         end=word.end,
                         confidence=word.confidence,
                     )
                 )
-                continue
-
-            # Check if any profanity word is contained within this word
-            # (handles cases like "motherfucker" containing "fuck")
-            for profanity in self.profanity_set:
-                if profanity in normalized and len(profanity) >= 4:
-                    matches.append(
-                        ProfanityMatch(
-                            word=profanity,
-                            original_word=word.word,
-                            start=word.start,
-                            end=word.end,
-                            confidence=word.confidence,
-                        )
-                    )
-                    break
 
         print(f"Detected {len(matches)} profanities")
         return matches
@@ -141,11 +228,13 @@ class ProfanityDetector:
         """Add words to the profanity list."""
         for word in words:
             self.profanity_set.add(word.lower().strip())
+        self._build_matcher()
 
     def remove_words(self, words: list[str]) -> None:
         """Remove words from the profanity list."""
         for word in words:
             self.profanity_set.discard(word.lower().strip())
+        self._build_matcher()
 
     def check_text(self, text: str) -> list[str]:
         """
@@ -159,22 +248,10 @@ class ProfanityDetector:
         Returns:
             List of profanity words found in the text
         """
-        found = []
-        # Normalize the entire text
-        words_in_text = re.findall(r"\w+", text.lower())
-
-        for word in words_in_text:
-            # Check exact match
-            if word in self.profanity_set:
-                if word not in found:
-                    found.append(word)
-                continue
-
-            # Check if any profanity is contained within this word
-            for profanity in self.profanity_set:
-                if profanity in word and len(profanity) >= 4:
-                    if profanity not in found:
-                        found.append(profanity)
-                    break
+        # \w+ tokens of the lowercased text are already normalized, so they can
+        # go straight through the same single-pass matcher as detect()
+        words_in_text = _WORD_RE.findall(text.lower())
+        matched = self._match_words(words_in_text)
 
-        return found
+        # Unique profanities, in order of first appearance
+        return list(dict.fromkeys(p for p in matched if p))
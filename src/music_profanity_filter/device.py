@@ -0,0 +1,32 @@
+"""
+Compute device selection.
+
+Picks the accelerator used for stem separation and transcription.
+"""
+
+
+def pick_device(preference: str = "auto") -> str:
+    """
+    Resolve a device preference to a concrete torch device name.
+
+    Args:
+        preference: One of "auto", "cuda", "mps" or "cpu". "auto" picks CUDA,
+                   then Apple MPS, then falls back to CPU.
+
+    Returns:
+        The device name to use
+    """
+    if preference != "auto":
+        return preference
+
+    try:
+        import torch
+    except ImportError:
+        return "cpu"
+
+    if torch.cuda.is_available():
+        return "cuda"
+    mps = getattr(torch.backends, "mps", None)
+    if mps is not None and mps.is_available():
+        return "mps"
+    return "cpu"
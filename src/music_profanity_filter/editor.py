@@ -4,12 +4,86 @@ Audio editing module.
 Handles muting profanity in vocal tracks and recombining with instrumentals.
 """
 
+import os
+import shutil
+import subprocess
 from pathlib import Path
 
+import numpy as np
 from pydub import AudioSegment
 
 from .detector import ProfanityMatch
 
+FFMPEG_AVAILABLE = shutil.which("ffmpeg") is not None
+
+# numpy dtypes for pydub sample widths (bytes per sample)
+_SAMPLE_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+
+# LAME algorithm quality (-compression_level, 0 = slowest/best, 9 = fastest)
+# for each encoder preset. Bitrate is unaffected, so output stays CBR.
+ENCODER_PRESETS = {"fast": 7, "medium": 5, "high": 2}
+
+
+def _mp3_encoder_args(encoder_preset: str | None) -> list[str]:
+    """Extra ffmpeg output arguments for an MP3 encoder preset."""
+    if encoder_preset is None:
+        return []
+    return ["-compression_level", str(ENCODER_PRESETS[encoder_preset]), "-threads", "0"]
+
+
+def _encoder_args(output_format: str, bitrate: str | None, encoder_preset: str | None) -> list[str]:
+    """ffmpeg output arguments selecting the encoder settings for a format."""
+    args = []
+    if output_format == "mp3":
+        args += ["-c:a", "libmp3lame", *_mp3_encoder_args(encoder_preset)]
+    if bitrate is not None and output_format in ("mp3", "ogg"):
+        args += ["-b:a", bitrate]
+    return args
+
+
+def _export_params(output_format: str, bitrate: str | None, encoder_preset: str | None) -> dict:
+    """pydub export() keyword arguments for the same encoder settings."""
+    export_params = {"format": output_format}
+    if bitrate is not None and output_format in ("mp3", "ogg"):
+        export_params["bitrate"] = bitrate
+    if output_format == "mp3" and encoder_preset is not None:
+        export_params["parameters"] = _mp3_encoder_args(encoder_preset)
+    return export_params
+
+
+def _merge_sections(
+    sections: list[tuple[float, float]], gap: float = 0.0
+) -> list[tuple[float, float]]:
+    """
+    Sort sections and merge any that overlap or lie less than gap seconds apart.
+
+    Profanities often come in runs, and their padded mute windows overlap.
+    Merging them keeps the ffmpeg enable expression (evaluated per audio
+    frame) and the number of pydub fades proportional to distinct cuts.
+    The merge runs over a single array: a new section starts wherever the
+    gap since everything before it is at least gap.
+    """
+    if not sections:
+        return []
+
+    bounds = np.array(sections, dtype=np.float64)
+    bounds = bounds[np.argsort(bounds[:, 0], kind="stable")]
+    # Running max, so a section nested inside an earlier one can't end a run
+    ends = np.maximum.accumulate(bounds[:, 1])
+
+    breaks = np.flatnonzero(bounds[1:, 0] - ends[:-1] >= gap) + 1
+    run_starts = bounds[np.concatenate(([0], breaks)), 0]
+    run_ends = ends[np.concatenate((breaks - 1, [len(bounds) - 1]))]
+    return list(zip(run_starts.tolist(), run_ends.tolist()))
+
+
+def _run_ffmpeg(args: list[str]) -> None:
+    """Run ffmpeg with the given arguments, raising on failure."""
+    cmd = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "error", *args]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed: {result.stderr}")
+
 
 class AudioEditor:
     """Edits audio tracks to remove profanity."""
@@ -33,6 +107,9 @@ class AudioEditor:
         """
         Mute specific time sections in an audio file.
 
+        Uses a single ffmpeg pass when ffmpeg is available, so the audio is
+        never decoded into Python memory. Falls back to pydub otherwise.
+
         Args:
             audio_path: Path to the input audio file
             sections: List of (start_seconds, end_seconds) tuples to mute
@@ -42,35 +119,108 @@ class AudioEditor:
             Path to the edited audio file
         """
         audio_path = Path(audio_path)
-        audio = AudioSegment.from_file(str(audio_path))
+        output_path = audio_path if output_path is None else Path(output_path)
 
-        if output_path is None:
-            output_path = audio_path
+        # Sort sections, merging those whose fades would overlap
+        sections = _merge_sections(sections, gap=2 * self.fade_ms / 1000)
 
-        # Sort sections by start time
-        sections = sorted(sections, key=lambda x: x[0])
+        # Convert once; both backends take plain strings
+        s_audio = str(audio_path)
+        output_format = output_path.suffix.lstrip(".")
 
-        # Process sections from end to start to maintain timing accuracy
-        for start_sec, end_sec in reversed(sections):
-            start_ms = int(start_sec * 1000)
-            end_ms = int(end_sec * 1000)
+        if FFMPEG_AVAILABLE:
+            self._mute_sections_ffmpeg(s_audio, sections, output_path, output_format)
+        else:
+            self._mute_sections_pydub(s_audio, sections, output_path, output_format)
 
-            # Clamp to audio bounds
-            start_ms = max(0, start_ms - self.fade_ms)
-            end_ms = min(len(audio), end_ms + self.fade_ms)
+        return output_path
 
-            # Create silent segment
-            duration_ms = end_ms - start_ms
-            silence = AudioSegment.silent(duration=duration_ms)
+    def _mute_filter(self, sections: list[tuple[float, float]]) -> str:
+        """Build an ffmpeg volume filter that silences the given sections."""
+        pad = self.fade_ms / 1000
+        ranges = "+".join(
+            f"between(t,{max(0.0, start - pad):.3f},{end + pad:.3f})" for start, end in sections
+        )
+        return f"volume=enable='{ranges}':volume=0"
 
-            # Replace section with silence
-            audio = audio[:start_ms] + silence + audio[end_ms:]
+    def _mute_sections_ffmpeg(
+        self,
+        audio_path: str,
+        sections: list[tuple[float, float]],
+        output_path: Path,
+        output_format: str,
+        bitrate: str | None = None,
+        encoder_preset: str | None = None,
+    ) -> None:
+        """Mute sections by streaming the file through ffmpeg's volume filter."""
+        # ffmpeg can't write to the file it's reading, so stage in-place edits.
+        # A missing output can't be the input, which skips resolving both paths.
+        in_place = output_path.exists() and os.path.samefile(output_path, audio_path)
+        target = output_path.with_name(f".{output_path.name}.tmp") if in_place else output_path
+
+        args = ["-i", audio_path, "-vn"]
+        if sections:
+            args += ["-af", self._mute_filter(sections)]
+        args += _encoder_args(output_format, bitrate, encoder_preset)
+        args += ["-f", output_format, str(target)]
+        _run_ffmpeg(args)
+
+        if in_place:
+            os.replace(target, output_path)
+
+    def _mute_sections_pydub(
+        self,
+        audio_path: str,
+        sections: list[tuple[float, float]],
+        output_path: Path,
+        output_format: str,
+        bitrate: str | None = None,
+        encoder_preset: str | None = None,
+    ) -> None:
+        """Mute sections of audio decoded with pydub."""
+        audio = AudioSegment.from_file(audio_path)
+        audio = self._mute_segment(audio, sections)
 
         # Export
-        output_path = Path(output_path)
-        audio.export(str(output_path), format=output_path.suffix.lstrip("."))
+        audio.export(str(output_path), **_export_params(output_format, bitrate, encoder_preset))
 
-        return output_path
+    def _mute_segment(
+        self,
+        audio: AudioSegment,
+        sections: list[tuple[float, float]],
+    ) -> AudioSegment:
+        """
+        Mute sections of an AudioSegment in a single copy of its samples.
+
+        Each section is zeroed from fade_ms before its start to fade_ms after
+        its end, the same range _mute_filter silences with ffmpeg. A half-Hann
+        fade of fade_ms on either side of that keeps the cut from clicking.
+        """
+        if not sections:
+            return audio
+
+        samples = np.frombuffer(audio.raw_data, dtype=_SAMPLE_DTYPES[audio.sample_width])
+        samples = samples.reshape(-1, audio.channels).copy()
+        sample_rate = audio.frame_rate
+        num_samples = len(samples)
+
+        fade = int(self.fade_ms * sample_rate / 1000)
+        fade_out = np.cos(np.linspace(0, np.pi / 2, fade, endpoint=False))[:, None] ** 2
+        fade_in = fade_out[::-1]
+
+        for start_sec, end_sec in sections:
+            # Pad by fade on both sides, then clamp to audio bounds
+            start = min(max(0, int(start_sec * sample_rate) - fade), num_samples)
+            end = min(max(start, int(end_sec * sample_rate) + fade), num_samples)
+            samples[start:end] = 0
+
+            if fade:
+                lead = samples[max(0, start - fade):start]
+                np.multiply(lead, fade_out[fade - len(lead):], out=lead, casting="unsafe")
+                tail = samples[end:end + fade]
+                np.multiply(tail, fade_in[:len(tail)], out=tail, casting="unsafe")
+
+        return audio._spawn(samples.tobytes())
 
     def mute_profanities(
         self,
@@ -92,6 +242,54 @@ class AudioEditor:
         sections = [(p.start, p.end) for p in profanities]
         return self.mute_sections(vocals_path, sections, output_path)
 
+    def mute_profanities_on_original(
+        self,
+        original_path: Path,
+        profanities: list[ProfanityMatch],
+        output_path: Path,
+        output_format: str = "mp3",
+        bitrate: str = "320k",
+        encoder_preset: str | None = None,
+    ) -> Path:
+        """
+        Mute profanities directly in the original mix, without recombining stems.
+
+        The whole mix, instrumentals included, is silenced over each
+        profanity. Used by fast mode, where vocals are separated only for
+        their timestamps.
+
+        Args:
+            original_path: Path to the original (unseparated) track
+            profanities: List of ProfanityMatch objects with timing info
+            output_path: Path for the edited output file
+            output_format: Output audio format (mp3, wav, flac, etc.)
+            bitrate: Bitrate for compressed formats
+            encoder_preset: MP3 encoder speed/quality preset (fast, medium, high).
+                            If None, uses the encoder's default.
+
+        Returns:
+            Path to the edited audio file
+        """
+        print(f"Muting {len(profanities)} sections in the original mix...")
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        sections = _merge_sections(
+            [(p.start, p.end) for p in profanities], gap=2 * self.fade_ms / 1000
+        )
+
+        if FFMPEG_AVAILABLE:
+            self._mute_sections_ffmpeg(
+                str(original_path), sections, output_path, output_format, bitrate, encoder_preset
+            )
+        else:
+            self._mute_sections_pydub(
+                str(original_path), sections, output_path, output_format, bitrate, encoder_preset
+            )
+
+        print(f"Saved edited track to {output_path}")
+        return output_path
+
     def combine_stems(
         self,
         vocals_path: Path,
@@ -99,23 +297,166 @@ class AudioEditor:
         output_path: Path,
         output_format: str = "mp3",
         bitrate: str = "320k",
+        encoder_preset: str | None = None,
     ) -> Path:
         """
         Combine vocal and instrumental stems into a single track.
 
+        Uses one ffmpeg amix pass when ffmpeg is available, streaming both stems
+        straight to the encoder. Falls back to pydub otherwise.
+
         Args:
             vocals_path: Path to the (edited) vocal track
             instrumentals_path: Path to the instrumental track
             output_path: Path for the combined output file
             output_format: Output audio format (mp3, wav, flac, etc.)
             bitrate: Bitrate for compressed formats
+            encoder_preset: MP3 encoder speed/quality preset (fast, medium, high).
+                            If None, uses the encoder's default.
 
         Returns:
             Path to the combined audio file
         """
         print("Combining stems...")
 
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._combine_stems(
+            vocals_path, instrumentals_path, output_path, output_format, bitrate, encoder_preset, []
+        )
+
+        print(f"Saved combined track to {output_path}")
+        return output_path
+
+    def mute_and_combine(
+        self,
+        vocals_path: Path,
+        instrumentals_path: Path,
+        profanities: list[ProfanityMatch],
+        output_path: Path,
+        output_format: str = "mp3",
+        bitrate: str = "320k",
+        encoder_preset: str | None = None,
+    ) -> Path:
+        """
+        Mute profanities in the vocals and mix them with the instrumentals.
+
+        Equivalent to mute_profanities followed by combine_stems, but the edited
+        vocals are never written to disk: ffmpeg applies the mute and the mix in
+        one filter graph, and the pydub fallback mutes the decoded vocals in
+        memory before overlaying them.
+
+        Args:
+            vocals_path: Path to the unedited vocal track
+            instrumentals_path: Path to the instrumental track
+            profanities: List of ProfanityMatch objects with timing info
+            output_path: Path for the combined output file
+            output_format: Output audio format (mp3, wav, flac, etc.)
+            bitrate: Bitrate for compressed formats
+            encoder_preset: MP3 encoder speed/quality preset (fast, medium, high).
+                            If None, uses the encoder's default.
+
+        Returns:
+            Path to the combined audio file
+        """
+        print(f"Muting {len(profanities)} sections and combining stems...")
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        sections = _merge_sections(
+            [(p.start, p.end) for p in profanities], gap=2 * self.fade_ms / 1000
+        )
+
+        self._combine_stems(
+            vocals_path,
+            instrumentals_path,
+            output_path,
+            output_format,
+            bitrate,
+            encoder_preset,
+            sections,
+        )
+
+        print(f"Saved combined track to {output_path}")
+        return output_path
+
+    def _combine_stems(
+        self,
+        vocals_path: Path,
+        instrumentals_path: Path,
+        output_path: Path,
+        output_format: str,
+        bitrate: str,
+        encoder_preset: str | None,
+        sections: list[tuple[float, float]],
+    ) -> None:
+        """Mix stems with ffmpeg, or with pydub when ffmpeg is missing or can't run the mix."""
+        if FFMPEG_AVAILABLE:
+            try:
+                self._combine_stems_ffmpeg(
+                    vocals_path,
+                    instrumentals_path,
+                    output_path,
+                    output_format,
+                    bitrate,
+                    encoder_preset,
+                    sections=sections,
+                )
+                return
+            except RuntimeError as e:
+                # amix's normalize option needs ffmpeg 4.4+; older builds
+                # reject the whole filter graph
+                print(f"ffmpeg mix failed, falling back to pydub: {e}")
+        self._combine_stems_pydub(
+            vocals_path,
+            instrumentals_path,
+            output_path,
+            output_format,
+            bitrate,
+            encoder_preset,
+            sections=sections,
+        )
+
+    def _combine_stems_ffmpeg(
+        self,
+        vocals_path: Path,
+        instrumentals_path: Path,
+        output_path: Path,
+        output_format: str,
+        bitrate: str,
+        encoder_preset: str | None,
+        sections: list[tuple[float, float]],
+    ) -> None:
+        """Mix stems with ffmpeg's amix filter (no normalization, pad to longest)."""
+        amix = "amix=inputs=2:duration=longest:normalize=0"
+        if sections:
+            graph = f"[0:a]{self._mute_filter(sections)}[v];[v][1:a]{amix}"
+        else:
+            graph = f"[0:a][1:a]{amix}"
+        args = [
+            "-i", str(vocals_path),
+            "-i", str(instrumentals_path),
+            "-filter_complex", graph,
+        ]
+        args += _encoder_args(output_format, bitrate, encoder_preset)
+        args += ["-f", output_format, str(output_path)]
+        _run_ffmpeg(args)
+
+    def _combine_stems_pydub(
+        self,
+        vocals_path: Path,
+        instrumentals_path: Path,
+        output_path: Path,
+        output_format: str,
+        bitrate: str,
+        encoder_preset: str | None,
+        sections: list[tuple[float, float]],
+    ) -> None:
+        """Mix stems by overlaying them with pydub."""
         vocals = AudioSegment.from_file(str(vocals_path))
+        if sections:
+            vocals = self._mute_segment(vocals, sections)
         instrumentals = AudioSegment.from_file(str(instrumentals_path))
 
         # Ensure both tracks are the same length
@@ -132,14 +473,5 @@ class AudioEditor:
         combined = instrumentals.overlay(vocals)
 
         # Export
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        export_params = {"format": output_format}
-        if output_format in ("mp3", "ogg"):
-            export_params["bitrate"] = bitrate
+        combined.export(str(output_path), **_export_params(output_format, bitrate, encoder_preset))
 
-        combined.export(str(output_path), **export_params)
-
-        print(f"Saved combined track to {output_path}")
-        return output_path
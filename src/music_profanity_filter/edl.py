@@ -5,10 +5,20 @@ Handles reading/writing EDL files for manual timestamp correction.
 """
 
 import json
+import re
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# The M:SS.mm form written by format_timestamp
+_TS_MSS = re.compile(r"^(\d+):(\d{1,2}(?:\.\d+)?)$")
+
 
 def format_timestamp(seconds: float) -> str:
     """
@@ -19,9 +29,10 @@ def format_timestamp(seconds: float) -> str:
         72.86 -> "1:12.86"
         185.5 -> "3:05.50"
     """
-    minutes = int(seconds // 60)
-    secs = seconds % 60
-    return f"{minutes}:{secs:05.2f}"
+    # Work in whole centiseconds so rounding can't produce "0:60.00"
+    minutes, centis = divmod(round(seconds * 100), 6000)
+    secs, centis = divmod(centis, 100)
+    return f"{minutes}:{secs:02d}.{centis:02d}"
 
 
 def parse_timestamp(timestamp: str) -> float:
@@ -36,6 +47,11 @@ def parse_timestamp(timestamp: str) -> float:
     """
     timestamp = timestamp.strip()
 
+    # Fast path for the format we write ourselves
+    m = _TS_MSS.match(timestamp)
+    if m:
+        return int(m[1]) * 60 + float(m[2])
+
     # Try to parse as float first (raw seconds)
     try:
         return float(timestamp)
@@ -88,6 +104,13 @@ class EditPoint:
         )
 
 
+def _json_default(obj):
+    """Serialize EditPoints inline while encoding an EDL."""
+    if isinstance(obj, EditPoint):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 @dataclass
 class EDL:
     """Edit Decision List for a song."""
@@ -105,6 +128,15 @@ class EDL:
             "edits": [e.to_dict() for e in self.edits],
         }
 
+    def _to_json_obj(self) -> dict:
+        """Like to_dict, but leaves edits as EditPoints for the encoder's default hook."""
+        return {
+            "source_file": self.source_file,
+            "generated": self.generated,
+            "stems_dir": self.stems_dir,
+            "edits": self.edits,
+        }
+
     @classmethod
     def from_dict(cls, data: dict) -> "EDL":
         return cls(
@@ -115,18 +147,32 @@ class EDL:
         )
 
     def save(self, path: Path) -> None:
-        """Save EDL to a JSON file."""
+        """Save EDL to a JSON file (uses orjson when installed)."""
         path = Path(path)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        if ORJSON_AVAILABLE:
+            path.write_bytes(
+                orjson.dumps(
+                    self._to_json_obj(),
+                    default=_json_default,
+                    # Route EditPoints through the hook instead of orjson's
+                    # built-in dataclass support, which would skip formatting
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS,
+                )
+            )
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self._to_json_obj(), f, indent=2, default=_json_default)
         print(f"EDL saved to: {path}")
 
     @classmethod
     def load(cls, path: Path) -> "EDL":
         """Load EDL from a JSON file."""
         path = Path(path)
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if ORJSON_AVAILABLE:
+            data = orjson.loads(path.read_bytes())
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
         return cls.from_dict(data)
 
 
@@ -4,8 +4,11 @@ Lyrics fetching module.
 Fetches lyrics from Genius using the lyricsgenius library.
 """
 
+import asyncio
+import hashlib
 import os
 import re
+import threading
 from pathlib import Path
 
 from mutagen.id3 import ID3, ID3NoHeaderError
@@ -16,6 +19,15 @@ try:
 except ImportError:
     GENIUS_AVAILABLE = False
 
+# Leading track numbers like "01 - ", "01. ", "04 - "
+_TRACKNUM_RE = re.compile(r"^\d+[\s\-\.]+")
+# "XXXEmbed" artifact Genius appends to the last line
+_EMBED_RE = re.compile(r"\d*Embed$")
+# Song title/contributor line Genius adds at the start
+_LYRICS_HDR_RE = re.compile(r"\A[^\n]*Lyrics[^\n]*(?:\n|\Z)")
+# "You might also like" plus the (usually 3) song suggestion lines after it
+_YMAL_RE = re.compile(r"(?:\A|\n)[ \t]*You might also like[ \t]*(?:\n[^\n]*){0,3}(?=\n|\Z)")
+
 
 class LyricsFetcher:
     """Fetches song lyrics from Genius."""
@@ -41,23 +53,38 @@ class LyricsFetcher:
                 "variable or pass access_token parameter."
             )
 
-        self._genius = None
+        # One Genius client per thread: each holds a requests.Session, which
+        # isn't safe to share between concurrent lookups
+        self._clients = threading.local()
+
+        # Fetched lyrics are cached on disk so repeat runs skip the Genius API.
+        # The cache is only an optimisation, so if it can't be created (e.g. a
+        # read-only home directory) caching is just turned off.
+        cache_home = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+        self._cache_dir: Path | None = cache_home / "music-profanity-filter" / "lyrics"
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"Lyrics cache disabled: {e}")
+            self._cache_dir = None
 
     @property
     def genius(self):
-        """Lazy-load the Genius client."""
-        if self._genius is None:
-            self._genius = lyricsgenius.Genius(
+        """Lazy-load the calling thread's Genius client."""
+        genius = getattr(self._clients, "genius", None)
+        if genius is None:
+            genius = lyricsgenius.Genius(
                 self.access_token,
                 verbose=False,
                 remove_section_headers=False,  # Keep [Verse], [Chorus] etc.
                 skip_non_songs=True,
             )
-        return self._genius
+            self._clients.genius = genius
+        return genius
 
     def fetch(self, title: str, artist: str) -> str | None:
         """
-        Fetch lyrics for a song.
+        Fetch lyrics for a song, using the on-disk cache when possible.
 
         Args:
             title: Song title
@@ -66,13 +93,28 @@ class LyricsFetcher:
         Returns:
             Lyrics text, or None if not found
         """
+        cache_path = None
+        if self._cache_dir is not None:
+            key = hashlib.sha1(f"{title.lower()}|{artist.lower()}".encode("utf-8")).hexdigest()
+            cache_path = self._cache_dir / f"{key}.txt"
+            try:
+                lyrics = cache_path.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Lyrics cache disabled: {e}")
+                self._cache_dir = cache_path = None
+            else:
+                print(f"Using cached lyrics for '{title}' by {artist}")
+                return lyrics
+
         print(f"Searching Genius for '{title}' by {artist}...")
 
         try:
             song = self.genius.search_song(title, artist)
             if song:
                 print(f"Found: {song.full_title}")
-                return self._clean_lyrics(song.lyrics)
+                lyrics = self._clean_lyrics(song.lyrics)
             else:
                 print("No lyrics found on Genius")
                 return None
@@ -80,6 +122,14 @@ class LyricsFetcher:
             print(f"Error fetching lyrics: {e}")
             return None
 
+        if lyrics and cache_path is not None:
+            try:
+                cache_path.write_text(lyrics, encoding="utf-8")
+            except OSError as e:
+                print(f"Lyrics cache disabled: {e}")
+                self._cache_dir = None
+        return lyrics
+
     def fetch_from_file(self, audio_path: Path) -> str | None:
         """
         Fetch lyrics using metadata from an audio file.
@@ -105,6 +155,15 @@ class LyricsFetcher:
 
         return self.fetch(title, artist)
 
+    async def fetch_from_file_async(self, audio_path: Path) -> str | None:
+        """
+        Fetch lyrics for an audio file without blocking the event loop.
+
+        Runs fetch_from_file in a worker thread, so several files can be
+        looked up concurrently with asyncio.gather or run_coroutine_threadsafe.
+        """
+        return await asyncio.to_thread(self.fetch_from_file, audio_path)
+
     def _get_metadata(self, audio_path: Path) -> tuple[str | None, str | None]:
         """Extract title and artist from ID3 tags."""
         try:
@@ -127,7 +186,7 @@ class LyricsFetcher:
         stem = audio_path.stem
 
         # Remove track numbers like "01 - ", "01. ", "04 - "
-        stem = re.sub(r"^\d+[\s\-\.]+", "", stem)
+        stem = _TRACKNUM_RE.sub("", stem)
 
         # Try "Artist - Title" or "Title - Artist" format
         if " - " in stem:
@@ -146,30 +205,10 @@ class LyricsFetcher:
 
         # Remove the song title/contributor line that Genius adds at the start
         # e.g., "Father Figure Lyrics[Verse 1]..." -> "[Verse 1]..."
-        lines = lyrics.split("\n")
-        if lines and "Lyrics" in lines[0]:
-            lines = lines[1:]
-
-        # Remove empty lines at start/end
-        while lines and not lines[0].strip():
-            lines.pop(0)
-        while lines and not lines[-1].strip():
-            lines.pop()
-
-        # Remove "XXXEmbed" at the end (Genius artifact)
-        if lines:
-            lines[-1] = re.sub(r"\d*Embed$", "", lines[-1])
-
-        # Remove "You might also like" artifacts
-        cleaned = []
-        skip_next = 0
-        for line in lines:
-            if skip_next > 0:
-                skip_next -= 1
-                continue
-            if line.strip() == "You might also like":
-                skip_next = 3  # Skip this + next 3 lines (usually song suggestions)
-                continue
-            cleaned.append(line)
-
-        return "\n".join(cleaned)
+        lyrics = _LYRICS_HDR_RE.sub("", lyrics, count=1)
+
+        # Remove empty lines at start/end, then the "XXXEmbed" Genius artifact
+        lyrics = _EMBED_RE.sub("", lyrics.strip())
+
+        # Remove "You might also like" artifacts (this + next 3 song suggestion lines)
+        return _YMAL_RE.sub("", lyrics).strip()
@@ -5,44 +5,112 @@ Copies ID3 tags from source to destination and embeds synchronized lyrics.
 """
 
 import csv
+import re
 from datetime import datetime
 from pathlib import Path
 
 from mutagen.id3 import ID3, SYLT, TIT2, Encoding, ID3NoHeaderError
 from mutagen.mp3 import MP3
 
+# Trailing characters that end an LRC line
+_PUNCT = frozenset(".!?,")
 
-def copy_tags(source_path: Path, dest_path: Path) -> None:
+# An LRC time tag, e.g. [01:12.86]. Metadata tags like [ar:Artist] don't match.
+_LRC_TIME_RE = re.compile(r"\[(\d+):(\d+(?:\.\d+)?)\]")
+
+# Tag blocks with cover art are often >100 KB; read and write them in large
+# chunks rather than mutagen's small default reads
+_IO_BUFFER_SIZE = 65536
+
+# Headroom reserved after the tag block so later tag edits fit in place
+# instead of shifting the whole audio payload
+_MIN_TAG_PADDING = 4096
+
+
+def _tag_padding(info) -> int:
+    """mutagen padding callback: keep existing padding, but at least _MIN_TAG_PADDING."""
+    return max(info.padding, _MIN_TAG_PADDING)
+
+
+def _read_id3(path: Path) -> ID3:
+    """Load ID3 tags through a large-buffered file handle."""
+    with open(path, "rb", buffering=_IO_BUFFER_SIZE) as f:
+        return ID3(f)
+
+
+def read_tags(path: Path) -> ID3 | None:
     """
-    Copy all ID3 tags from source file to destination file.
+    Load a file's ID3 tags.
 
     Args:
-        source_path: Path to the original audio file
-        dest_path: Path to the file to copy tags to
-    """
-    source_path = Path(source_path)
-    dest_path = Path(dest_path)
+        path: Path to the audio file
 
+    Returns:
+        The file's tags, or None if it has no ID3 header
+    """
     try:
-        # Load source tags
-        source_tags = ID3(str(source_path))
+        return _read_id3(path)
     except ID3NoHeaderError:
-        print("No ID3 tags found in source file")
-        return
+        return None
+
+
+def save_tags(tags: ID3, path: Path) -> None:
+    """Write ID3 tags to a file through a large-buffered file handle."""
+    with open(path, "r+b", buffering=_IO_BUFFER_SIZE) as f:
+        tags.save(f, padding=_tag_padding)
+
 
+def _open_tags(path: Path) -> ID3:
+    """Load a file's ID3 tags, creating an empty (unsaved) header if it has none."""
     try:
-        # Try to load existing tags on dest, or create new
-        dest_tags = ID3(str(dest_path))
+        return _read_id3(path)
     except ID3NoHeaderError:
-        # No tags exist, create new ID3 header
-        dest_audio = MP3(str(dest_path))
-        dest_audio.add_tags()
-        dest_audio.save()
-        dest_tags = ID3(str(dest_path))
+        # add_tags() leaves a fresh ID3 instance on the file object; it is
+        # written by the caller's single save()
+        with open(path, "rb", buffering=_IO_BUFFER_SIZE) as f:
+            audio = MP3(f)
+        audio.add_tags()
+        return audio.tags
+
+
+def copy_tags(
+    source_path: Path,
+    dest_path: Path,
+    tags: ID3 | None = None,
+    save: bool = True,
+    source_tags: ID3 | None = None,
+) -> ID3 | None:
+    """
+    Copy all ID3 tags from source file to destination file.
 
-    # Copy all frames from source to dest
-    for frame_id in source_tags.keys():
-        dest_tags[frame_id] = source_tags[frame_id]
+    Args:
+        source_path: Path to the original audio file
+        dest_path: Path to the file to copy tags to
+        tags: Already-loaded destination tags to merge into. If None, loads them.
+        save: If False, leaves saving the returned tags to the caller
+        source_tags: Already-loaded source tags (see read_tags). If None, reads
+                     them from source_path.
+
+    Returns:
+        The destination tags, or the tags argument if the source has no ID3 tags
+    """
+    if source_tags is None:
+        source_tags = read_tags(source_path)
+    if source_tags is None:
+        print("No ID3 tags found in source file")
+        return tags
+
+    dest_tags = tags if tags is not None else _open_tags(dest_path)
+
+    # Copy all frames from source to dest. Frame objects are shared rather than
+    # rebuilt, and cover art the destination already carries (e.g. when
+    # overwriting the original) is left in place.
+    for key, frame in source_tags.items():
+        if frame.FrameID == "APIC":
+            existing = dest_tags.get(key)
+            if existing is not None and existing.data == frame.data:
+                continue
+        dest_tags[key] = frame
 
     # Update title to include "(clean)" suffix
     if "TIT2" in dest_tags:
@@ -50,15 +118,19 @@ def copy_tags(source_path: Path, dest_path: Path) -> None:
         if not original_title.endswith("(clean)"):
             dest_tags["TIT2"] = TIT2(encoding=Encoding.UTF8, text=f"{original_title} (clean)")
 
-    dest_tags.save(str(dest_path))
+    if save:
+        save_tags(dest_tags, dest_path)
     print(f"Copied ID3 tags from original file")
+    return dest_tags
 
 
 def embed_synced_lyrics(
     audio_path: Path,
     words: list,  # list of TranscribedWord
     language: str = "eng",
-) -> None:
+    tags: ID3 | None = None,
+    save: bool = True,
+) -> ID3 | None:
     """
     Embed synchronized lyrics into an MP3 file using the SYLT frame.
 
@@ -66,28 +138,23 @@ def embed_synced_lyrics(
         audio_path: Path to the MP3 file
         words: List of TranscribedWord objects with timing info
         language: ISO 639-2 language code (default: "eng" for English)
-    """
-    audio_path = Path(audio_path)
+        tags: Already-loaded tags for audio_path. If None, loads them.
+        save: If False, leaves saving the returned tags to the caller
 
-    if not audio_path.suffix.lower() == ".mp3":
-        print(f"Synced lyrics only supported for MP3 files, skipping for {audio_path.suffix}")
-        return
+    Returns:
+        The updated tags, or None if the file isn't an MP3
+    """
+    suffix = Path(audio_path).suffix
+    if suffix.lower() != ".mp3":
+        print(f"Synced lyrics only supported for MP3 files, skipping for {suffix}")
+        return None
 
-    try:
-        tags = ID3(str(audio_path))
-    except ID3NoHeaderError:
-        audio = MP3(str(audio_path))
-        audio.add_tags()
-        audio.save()
-        tags = ID3(str(audio_path))
+    if tags is None:
+        tags = _open_tags(audio_path)
 
     # Build SYLT data: list of (text, timestamp_ms) tuples
     # SYLT format expects timestamps in milliseconds
-    sylt_data = []
-    for word in words:
-        timestamp_ms = int(word.start * 1000)
-        # Add the word with its timestamp
-        sylt_data.append((word.word + " ", timestamp_ms))
+    sylt_data = [(word.word + " ", int(word.start * 1000)) for word in words]
 
     # Remove any existing SYLT frames
     tags.delall("SYLT")
@@ -104,8 +171,10 @@ def embed_synced_lyrics(
     )
 
     tags.add(sylt_frame)
-    tags.save(str(audio_path))
+    if save:
+        save_tags(tags, audio_path)
     print(f"Embedded synchronized lyrics ({len(words)} words)")
+    return tags
 
 
 def generate_lrc(words: list, output_path: Path | None = None) -> str:
@@ -119,41 +188,31 @@ def generate_lrc(words: list, output_path: Path | None = None) -> str:
     Returns:
         LRC formatted string
     """
-    lines = []
-    current_line = []
-    current_line_start = None
-
-    for word in words:
-        if current_line_start is None:
-            current_line_start = word.start
-
-        current_line.append(word.word)
-
-        # Start new line on punctuation or every ~10 words
-        if (
-            word.word.rstrip().endswith((".", "!", "?", ","))
-            or len(current_line) >= 10
-        ):
+    # Flat list of timestamp, text and newline pieces, joined once at the end
+    parts: list[str] = []
+    current_line: list[str] = []  # already-stripped tokens
+    line_start = 0.0
+    last_index = len(words) - 1
+
+    for i, word in enumerate(words):
+        token = word.word.strip()
+        if not current_line:
+            line_start = word.start
+        current_line.append(token)
+
+        # Start new line on punctuation or every ~10 words; the last word
+        # flushes whatever remains
+        if token[-1:] in _PUNCT or len(current_line) >= 10 or i == last_index:
             # Format timestamp as [mm:ss.xx]
-            minutes = int(current_line_start // 60)
-            seconds = current_line_start % 60
-            timestamp = f"[{minutes:02d}:{seconds:05.2f}]"
-
-            line_text = " ".join(w.strip() for w in current_line)
-            lines.append(f"{timestamp}{line_text}")
-
+            minutes = int(line_start // 60)
+            seconds = line_start % 60
+            parts += (f"[{minutes:02d}:{seconds:05.2f}]", " ".join(current_line), "\n")
             current_line = []
-            current_line_start = None
-
-    # Don't forget remaining words
-    if current_line and current_line_start is not None:
-        minutes = int(current_line_start // 60)
-        seconds = current_line_start % 60
-        timestamp = f"[{minutes:02d}:{seconds:05.2f}]"
-        line_text = " ".join(w.strip() for w in current_line)
-        lines.append(f"{timestamp}{line_text}")
 
-    lrc_content = "\n".join(lines)
+    # Lines are newline-separated, without a trailing newline
+    if parts:
+        parts.pop()
+    lrc_content = "".join(parts)
 
     if output_path:
         output_path = Path(output_path)
@@ -163,6 +222,36 @@ def generate_lrc(words: list, output_path: Path | None = None) -> str:
     return lrc_content
 
 
+def parse_lrc(lrc_path: Path) -> list[tuple[float, str]]:
+    """
+    Parse an LRC lyrics file into timed lines.
+
+    Lines carrying several time tags (e.g. a repeated chorus) produce one
+    entry per tag. Lines without a time tag are ignored.
+
+    Args:
+        lrc_path: Path to the .lrc file
+
+    Returns:
+        List of (start_seconds, text) tuples, sorted by start time
+    """
+    lines = []
+    # utf-8-sig so a BOM doesn't hide the first time tag; files in a legacy
+    # encoding still parse, with their non-ASCII characters replaced
+    with open(lrc_path, "r", encoding="utf-8-sig", errors="replace") as f:
+        for line in f:
+            pos = 0
+            starts = []
+            while m := _LRC_TIME_RE.match(line, pos):
+                starts.append(int(m[1]) * 60 + float(m[2]))
+                pos = m.end()
+            text = line[pos:].strip()
+            lines.extend((start, text) for start in starts)
+
+    lines.sort(key=lambda line: line[0])
+    return lines
+
+
 def write_edit_log(
     source_path: Path,
     profanities: list,
@@ -187,7 +276,7 @@ def write_edit_log(
     artist = ""
     title = ""
     try:
-        tags = ID3(str(source_path))
+        tags = _read_id3(source_path)
         artist = str(tags.get("TPE1", "")) or ""
         title = str(tags.get("TIT2", "")) or ""
     except ID3NoHeaderError:
@@ -4,18 +4,47 @@ Main pipeline module.
 Orchestrates the full profanity filtering workflow.
 """
 
+import multiprocessing
+import os
+import queue
 import shutil
 import tempfile
-from dataclasses import dataclass
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Callable, Iterable, Iterator
 
 from .detector import ProfanityDetector, ProfanityMatch
+from .device import pick_device
 from .edl import EDL, EditPoint, create_edl
 from .editor import AudioEditor
-from .metadata import copy_tags, embed_synced_lyrics, write_edit_log
-from .separator import StemSeparator
+from .metadata import (
+    copy_tags,
+    embed_synced_lyrics,
+    parse_lrc,
+    read_tags,
+    save_tags,
+    write_edit_log,
+)
+from .separator import StemSeparator, find_stems
 from .transcriber import Transcriber, TranscribedWord
 
+# generate_edl trusts a sidecar .lrc instead of separating and transcribing
+# when the lyrics prescreen finds at most this many distinct profanities
+LRC_FAST_PATH_MAX_HITS = 3
+
+# Longest a single word is assumed to last when spreading an LRC line's words
+# over its time span (lines can run into long instrumental gaps)
+_LRC_MAX_WORD_SECONDS = 0.6
+
+# Matches shorter than this (e.g. squeezed together by lyrics alignment)
+# have nothing to mute
+_MIN_MUTE_SECONDS = 1e-3
+
+# How many separated tracks filter_batch lets pile up ahead of transcription
+BATCH_QUEUE_SIZE = 2
+
 
 @dataclass
 class FilterResult:
@@ -29,6 +58,92 @@ class FilterResult:
     error: str | None = None
     edl_path: Path | None = None  # Path to generated EDL file
     stems_dir: Path | None = None  # Path to stems directory for re-use
+    # Zero-length matches left unmuted
+    profanities_skipped: list[ProfanityMatch] = field(default_factory=list)
+
+
+@dataclass
+class SeparatedTrack:
+    """A track that has been separated and scanned, ready for editing."""
+
+    input_path: Path
+    output_path: Path
+    work_dir: Path  # Temp directory holding the stems
+    vocals_path: Path
+    instrumentals_path: Path | None  # None in fast mode, which mutes the original mix
+    words: list[TranscribedWord]
+    profanities: list[ProfanityMatch]
+    skipped: list[ProfanityMatch] = field(default_factory=list)  # Too short to mute
+
+
+def _clean_name(input_path: Path) -> str:
+    """File name for the cleaned version of a track."""
+    return f"{input_path.stem} (clean){input_path.suffix}"
+
+
+def _output_format(output_path: Path) -> str:
+    """Encoder format for an output path, defaulting to MP3."""
+    return output_path.suffix.lstrip(".").lower() or "mp3"
+
+
+def _split_audible(
+    profanities: list[ProfanityMatch],
+) -> tuple[list[ProfanityMatch], list[ProfanityMatch]]:
+    """Split matches into those long enough to mute and those too short to."""
+    audible = []
+    skipped = []
+    for p in profanities:
+        (audible if p.end - p.start > _MIN_MUTE_SECONDS else skipped).append(p)
+    return audible, skipped
+
+
+def _async_rmtree(path: Path) -> None:
+    """
+    Delete a directory tree without blocking the caller.
+
+    The tree is renamed out of the way first, so its path is free again at
+    once, then unlinked on a background thread. Falls back to deleting in
+    place if the rename fails.
+    """
+    trash = path.parent / f".trash_{os.getpid()}_{id(path)}_{path.name}"
+    try:
+        os.rename(path, trash)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    # Not a daemon, so the interpreter finishes deleting before it exits
+    # instead of leaving trash directories behind
+    threading.Thread(
+        target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}
+    ).start()
+
+
+def _edit_and_combine(
+    track: SeparatedTrack, fade_ms: int, encoder_preset: str | None = None
+) -> Path:
+    """
+    Mute a track's profanities and recombine its stems.
+
+    Module-level so it can run in a ProcessPoolExecutor worker.
+    """
+    editor = AudioEditor(fade_ms=fade_ms)
+    output_format = _output_format(track.output_path)
+    if track.instrumentals_path is None:
+        return editor.mute_profanities_on_original(
+            track.input_path,
+            track.profanities,
+            track.output_path,
+            output_format=output_format,
+            encoder_preset=encoder_preset,
+        )
+    return editor.mute_and_combine(
+        track.vocals_path,
+        track.instrumentals_path,
+        track.profanities,
+        track.output_path,
+        output_format=output_format,
+        encoder_preset=encoder_preset,
+    )
 
 
 class MusicProfanityFilter:
@@ -44,6 +159,9 @@ class MusicProfanityFilter:
         whisper_model: str = "base",
         profanity_list_path: Path | None = None,
         keep_temp_files: bool = False,
+        device: str = "auto",
+        compute_type: str = "auto",
+        fast_mode: bool = False,
     ):
         """
         Initialize the music profanity filter.
@@ -53,12 +171,121 @@ class MusicProfanityFilter:
             whisper_model: Whisper model size for transcription
             profanity_list_path: Path to custom profanity word list
             keep_temp_files: If True, don't delete intermediate files
+            device: Compute device (auto, cuda, mps, cpu). "auto" picks the
+                   best available accelerator.
+            compute_type: Whisper (CTranslate2) compute type. "auto" picks
+                         int8_float16 on CUDA and int8 on CPU.
+            fast_mode: If True, write only the vocals stem and mute the
+                      original mix instead of recombining stems. Skips the
+                      instrumentals encode and the remix, but the
+                      instrumentals are muted along with the vocals.
+
+        Components are created on first use, so code paths that never separate,
+        transcribe or edit don't pay for them. The Whisper model is loaded in
+        the background while the first track's stems are separated.
         """
-        self.separator = StemSeparator(model=demucs_model)
-        self.transcriber = Transcriber(model_size=whisper_model)
-        self.detector = ProfanityDetector(word_list_path=profanity_list_path)
-        self.editor = AudioEditor()
+        self.demucs_model = demucs_model
+        self.whisper_model = whisper_model
+        self.profanity_list_path = profanity_list_path
+        self.device_preference = device
+        self.compute_type = compute_type
         self.keep_temp_files = keep_temp_files
+        self.fast_mode = fast_mode
+        self._device = None
+        self._separator = None
+        self._transcriber = None
+        self._detector = None
+        self._editor = None
+
+        # Background jobs that overlap with separation: reading source tags
+        # and loading the Whisper model. The pool is started on first use and
+        # runs until close().
+        self._io_pool: ThreadPoolExecutor | None = None
+        self._warmup: Future | None = None
+
+    def __enter__(self) -> "MusicProfanityFilter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shut down the background thread pool, waiting for any pending jobs.
+
+        The filter stays usable afterwards; the pool is started again on
+        next use.
+        """
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
+
+    @property
+    def io_pool(self) -> ThreadPoolExecutor:
+        """Lazily start the background thread pool."""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="music_filter_io")
+        return self._io_pool
+
+    @staticmethod
+    def _warm_up_transcriber(transcriber: Transcriber) -> None:
+        """Load the Whisper model, leaving any error to surface on first real use."""
+        try:
+            transcriber.model
+        except Exception:
+            pass
+
+    def _start_warmup(self) -> None:
+        """Start loading the Whisper model in the background, once per instance."""
+        if self._warmup is None:
+            # Resolve the transcriber (and device) here so only the model load
+            # itself runs off-thread
+            self._warmup = self.io_pool.submit(self._warm_up_transcriber, self.transcriber)
+
+    def _wait_for_warmup(self) -> None:
+        """Block until the background Whisper load has finished."""
+        if self._warmup is not None:
+            self._warmup.result()
+
+    @property
+    def device(self) -> str:
+        """Lazily resolve the compute device (detection imports torch)."""
+        if self._device is None:
+            self._device = pick_device(self.device_preference)
+            print(f"Using device: {self._device}")
+        return self._device
+
+    @property
+    def separator(self) -> StemSeparator:
+        """Lazy-load the stem separator."""
+        if self._separator is None:
+            self._separator = StemSeparator(model=self.demucs_model, device=self.device)
+        return self._separator
+
+    @property
+    def transcriber(self) -> Transcriber:
+        """Lazy-load the transcriber."""
+        if self._transcriber is None:
+            self._transcriber = Transcriber(
+                model_size=self.whisper_model,
+                device=self.device,
+                compute_type=self.compute_type,
+            )
+        return self._transcriber
+
+    @property
+    def detector(self) -> ProfanityDetector:
+        """Lazy-load the profanity detector (reads the word list)."""
+        if self._detector is None:
+            self._detector = ProfanityDetector(word_list_path=self.profanity_list_path)
+        return self._detector
+
+    @property
+    def editor(self) -> AudioEditor:
+        """Lazy-load the audio editor."""
+        if self._editor is None:
+            self._editor = AudioEditor()
+        return self._editor
 
     def filter(
         self,
@@ -67,6 +294,7 @@ class MusicProfanityFilter:
         overwrite: bool = False,
         preview_callback: callable = None,
         lyrics: str | None = None,
+        encoder_preset: str | None = None,
     ) -> FilterResult:
         """
         Filter profanity from a music track.
@@ -78,6 +306,7 @@ class MusicProfanityFilter:
             preview_callback: Optional callback function that receives profanities list.
                              Should return True to proceed, False to cancel.
             lyrics: Optional reference lyrics text for improved alignment accuracy.
+            encoder_preset: MP3 encoder speed/quality preset (fast, medium, high).
 
         Returns:
             FilterResult with details about the operation
@@ -98,12 +327,13 @@ class MusicProfanityFilter:
             if overwrite:
                 output_path = input_path
             else:
-                output_path = input_path.parent / f"{input_path.stem} (clean){input_path.suffix}"
+                output_path = input_path.with_name(_clean_name(input_path))
         else:
             output_path = Path(output_path)
+        output_format = _output_format(output_path)
 
         # Determine step count based on whether lyrics are provided
-        total_steps = 6 if lyrics else 5
+        total_steps = 5 if lyrics else 4
         step = 0
 
         # Early check: if we have lyrics, scan them for profanity first
@@ -128,16 +358,23 @@ class MusicProfanityFilter:
         temp_dir = Path(tempfile.mkdtemp(prefix="music_filter_"))
 
         try:
+            # Parse the source tags and load Whisper in the background while
+            # stems are separated
+            source_tags = self.io_pool.submit(read_tags, input_path)
+            self._start_warmup()
+
             # Separate stems
             step += 1
             print(f"\n[{step}/{total_steps}] Separating stems from {input_path.name}...")
-            stems = self.separator.separate(input_path, output_dir=temp_dir)
+            stems = self.separator.separate(
+                input_path, output_dir=temp_dir, fast_mode=self.fast_mode
+            )
             vocals_path = stems["vocals"]
-            instrumentals_path = stems["instrumentals"]
 
             # Transcribe vocals
             step += 1
             print(f"\n[{step}/{total_steps}] Transcribing vocals...")
+            self._wait_for_warmup()
             if lyrics:
                 words = self.transcriber.transcribe_with_context(vocals_path, lyrics)
             else:
@@ -170,28 +407,44 @@ class MusicProfanityFilter:
                     success=True,
                 )
 
-            # Edit vocals (mute profanity)
-            step += 1
-            print(f"\n[{step}/{total_steps}] Muting {len(profanities)} profanities in vocals...")
-            edited_vocals_path = temp_dir / "edited_vocals.wav"
-            self.editor.mute_profanities(vocals_path, profanities, edited_vocals_path)
+            profanities, skipped = _split_audible(profanities)
+            if not profanities:
+                self._copy_unedited(input_path, output_path, words, source_tags)
+                return FilterResult(
+                    input_path=input_path,
+                    output_path=output_path,
+                    profanities_found=[],
+                    transcribed_words=words,
+                    success=True,
+                    profanities_skipped=skipped,
+                )
 
-            # Recombine and export
+            # Mute profanity in the vocals and recombine in a single pass
             step += 1
-            print(f"\n[{step}/{total_steps}] Combining stems and exporting...")
-            output_format = output_path.suffix.lstrip(".") or "mp3"
-            self.editor.combine_stems(
-                edited_vocals_path,
-                instrumentals_path,
-                output_path,
-                output_format=output_format,
+            print(
+                f"\n[{step}/{total_steps}] Muting {len(profanities)} profanities "
+                "and exporting..."
             )
+            if self.fast_mode:
+                self.editor.mute_profanities_on_original(
+                    input_path,
+                    profanities,
+                    output_path,
+                    output_format=output_format,
+                    encoder_preset=encoder_preset,
+                )
+            else:
+                self.editor.mute_and_combine(
+                    vocals_path,
+                    stems["instrumentals"],
+                    profanities,
+                    output_path,
+                    output_format=output_format,
+                    encoder_preset=encoder_preset,
+                )
 
             # Copy metadata and embed synced lyrics
-            print(f"\nCopying metadata...")
-            copy_tags(input_path, output_path)
-            if words and output_path.suffix.lower() == ".mp3":
-                embed_synced_lyrics(output_path, words)
+            self._write_metadata(input_path, output_path, words, source_tags)
 
             # Log the edits
             write_edit_log(input_path, profanities)
@@ -204,6 +457,7 @@ class MusicProfanityFilter:
                 profanities_found=profanities,
                 transcribed_words=words,
                 success=True,
+                profanities_skipped=skipped,
             )
 
         except Exception as e:
@@ -219,7 +473,7 @@ class MusicProfanityFilter:
         finally:
             # Cleanup temp files
             if not self.keep_temp_files and temp_dir.exists():
-                shutil.rmtree(temp_dir)
+                _async_rmtree(temp_dir)
 
     def detect_only(self, input_path: Path | str) -> list[ProfanityMatch]:
         """
@@ -238,9 +492,13 @@ class MusicProfanityFilter:
 
         try:
             # Separate stems
-            stems = self.separator.separate(input_path, output_dir=temp_dir)
+            self._start_warmup()
+            stems = self.separator.separate(
+                input_path, output_dir=temp_dir, fast_mode=self.fast_mode
+            )
 
             # Transcribe
+            self._wait_for_warmup()
             words = self.transcriber.transcribe(stems["vocals"])
 
             # Detect
@@ -248,7 +506,453 @@ class MusicProfanityFilter:
 
         finally:
             if not self.keep_temp_files:
-                shutil.rmtree(temp_dir)
+                _async_rmtree(temp_dir)
+
+    def transcribe_vocals(self, vocals_paths: list[Path]) -> list[list[TranscribedWord]]:
+        """
+        Transcribe several vocal tracks in turn with the batched Whisper backend.
+
+        Args:
+            vocals_paths: Paths to separated vocal tracks
+
+        Returns:
+            List of TranscribedWord lists, in the same order as vocals_paths
+        """
+        return self.transcriber.transcribe_files([Path(p) for p in vocals_paths])
+
+    def detect_only_batch(self, input_paths: list[Path | str]) -> list[list[ProfanityMatch]]:
+        """
+        Detect profanity in several files.
+
+        All files are separated first, then their vocals are transcribed back
+        to back, so the Whisper model is loaded once and stays busy.
+
+        Args:
+            input_paths: Paths to the input audio files
+
+        Returns:
+            List of ProfanityMatch lists, in the same order as input_paths
+        """
+        input_paths = [Path(p) for p in input_paths]
+        temp_dir = Path(tempfile.mkdtemp(prefix="music_filter_"))
+
+        try:
+            # Separate stems (one subdirectory per file, in case stems collide)
+            self._start_warmup()
+            vocals_paths = []
+            for i, input_path in enumerate(input_paths):
+                stems = self.separator.separate(
+                    input_path, output_dir=temp_dir / str(i), fast_mode=self.fast_mode
+                )
+                vocals_paths.append(stems["vocals"])
+
+            # Transcribe
+            words_per_file = self.transcribe_vocals(vocals_paths)
+
+            # Detect
+            return [self.detector.detect(words) for words in words_per_file]
+
+        finally:
+            if not self.keep_temp_files:
+                _async_rmtree(temp_dir)
+
+    def _separate_for_scan(
+        self, input_path: Path, lyrics: str | None = None
+    ) -> tuple[Path, dict[str, Path]] | None:
+        """
+        Prescreen a track's lyrics, then separate its stems into a new work dir.
+
+        Args:
+            input_path: Path to the input audio file
+            lyrics: Optional reference lyrics text to prescreen
+
+        Returns:
+            (work_dir, stems), or None if the lyrics contain no profanity
+        """
+        if lyrics:
+            print("\nChecking lyrics for profanity...")
+            profanity_in_lyrics = self.detector.check_text(lyrics)
+            if not profanity_in_lyrics:
+                print("\nNo profanity found in lyrics - nothing to do.")
+                return None
+            print(f"Found potential profanity in lyrics: {', '.join(profanity_in_lyrics)}")
+
+        work_dir = Path(tempfile.mkdtemp(prefix="music_filter_"))
+
+        try:
+            print(f"\nSeparating stems from {input_path.name}...")
+            self._start_warmup()
+            stems = self.separator.separate(
+                input_path, output_dir=work_dir, fast_mode=self.fast_mode
+            )
+        except Exception:
+            if not self.keep_temp_files:
+                _async_rmtree(work_dir)
+            raise
+
+        return work_dir, stems
+
+    def _scan_stems(
+        self,
+        input_path: Path,
+        output_path: Path,
+        work_dir: Path,
+        stems: dict[str, Path],
+        lyrics: str | None = None,
+    ) -> SeparatedTrack:
+        """Transcribe a track's separated vocals and detect profanity in them."""
+        try:
+            print(f"\nTranscribing vocals from {input_path.name}...")
+            self._wait_for_warmup()
+            if lyrics:
+                words = self.transcriber.transcribe_with_context(stems["vocals"], lyrics)
+            else:
+                words = self.transcriber.transcribe(stems["vocals"])
+
+            print("\nDetecting profanity...")
+            profanities = self.detector.detect(words)
+        except Exception:
+            if not self.keep_temp_files:
+                _async_rmtree(work_dir)
+            raise
+
+        return SeparatedTrack(
+            input_path=input_path,
+            output_path=output_path,
+            work_dir=work_dir,
+            vocals_path=stems["vocals"],
+            instrumentals_path=stems.get("instrumentals"),
+            words=words,
+            profanities=profanities,
+        )
+
+    def _copy_unedited(
+        self,
+        input_path: Path,
+        output_path: Path,
+        words: list[TranscribedWord],
+        source_tags: Future | None = None,
+    ) -> None:
+        """
+        Write the original audio as the cleaned track when no match is long enough to mute.
+
+        A byte copy keeps the original encoding instead of re-encoding
+        recombined stems that would be identical. An output in another format
+        is transcoded from the original instead, with nothing muted. Metadata
+        and the edit log are then written as for any other cleaned track.
+        """
+        print("\nAll matches are zero-length - nothing to mute.")
+        if not (output_path.exists() and os.path.samefile(input_path, output_path)):
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            if _output_format(output_path) == _output_format(input_path):
+                shutil.copyfile(input_path, output_path)
+            else:
+                self.editor.mute_sections(input_path, [], output_path)
+
+        self._write_metadata(input_path, output_path, words, source_tags)
+        write_edit_log(input_path, [])
+
+        print(f"\nDone! Original audio kept at: {output_path}")
+
+    def _write_metadata(
+        self,
+        input_path: Path,
+        output_path: Path,
+        words: list[TranscribedWord],
+        source_tags: Future | None = None,
+    ) -> None:
+        """
+        Copy tags from the input to the cleaned output and embed synced lyrics.
+
+        Args:
+            input_path: Path to the original audio file
+            output_path: Path to the cleaned audio file
+            words: Transcribed words for the SYLT frame (MP3 only)
+            source_tags: Optional pending read_tags(input_path) result
+        """
+        print("\nCopying metadata...")
+        tags = source_tags.result() if source_tags is not None else read_tags(input_path)
+
+        # Merge both into one set of tags so the output is written once
+        dest_tags = None
+        if tags is None:
+            print("No ID3 tags found in source file")
+        else:
+            dest_tags = copy_tags(input_path, output_path, save=False, source_tags=tags)
+        if words and _output_format(output_path) == "mp3":
+            dest_tags = embed_synced_lyrics(output_path, words, tags=dest_tags, save=False)
+        if dest_tags is not None:
+            save_tags(dest_tags, output_path)
+
+    def _finish_track(
+        self, track: SeparatedTrack, source_tags: Future | None = None
+    ) -> FilterResult:
+        """Copy metadata to an edited track and log its edits."""
+        output_path = track.output_path
+        self._write_metadata(track.input_path, output_path, track.words, source_tags)
+
+        write_edit_log(track.input_path, track.profanities)
+
+        print(f"\nDone! Cleaned track saved to: {output_path}")
+
+        return FilterResult(
+            input_path=track.input_path,
+            output_path=output_path,
+            profanities_found=track.profanities,
+            transcribed_words=track.words,
+            success=True,
+            profanities_skipped=track.skipped,
+        )
+
+    def _prepare_tracks(
+        self,
+        input_paths: list[Path],
+        output_dir: Path | None,
+        overwrite: bool,
+        lyrics: list[str | None | Exception],
+    ) -> Iterator[tuple]:
+        """
+        Separate each track in turn.
+
+        Yields:
+            (input_path, output_path, source_tags, lyrics, separated) per track,
+            where separated is the (work_dir, stems) pair, None if the lyrics
+            prescreen found nothing to do, or the exception that stopped the track
+        """
+        for input_path, track_lyrics in zip(input_paths, lyrics):
+            if output_dir:
+                output_path = output_dir / _clean_name(input_path)
+            elif overwrite:
+                output_path = input_path
+            else:
+                output_path = input_path.with_name(_clean_name(input_path))
+
+            source_tags = self.io_pool.submit(read_tags, input_path)
+            if isinstance(track_lyrics, Exception):
+                yield input_path, output_path, source_tags, None, track_lyrics
+                continue
+            try:
+                separated = self._separate_for_scan(input_path, track_lyrics)
+            except Exception as e:
+                separated = e
+            yield input_path, output_path, source_tags, track_lyrics, separated
+
+    def _filter_tracks(
+        self,
+        tracks: Iterable[tuple],
+        max_workers: int | None = None,
+        encoder_preset: str | None = None,
+    ) -> list[FilterResult]:
+        """
+        Scan separated tracks as they arrive and hand their edits to a process pool.
+
+        Args:
+            tracks: Tracks as yielded by _prepare_tracks, in input order
+            max_workers: Editing processes. Defaults to half the CPU count.
+            encoder_preset: MP3 encoder speed/quality preset (fast, medium, high).
+
+        Returns:
+            List of FilterResult objects, in the order the tracks arrived
+        """
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 2) // 2)
+
+        results: list[FilterResult | None] = []
+        # Edit future -> (index, track, source tags future)
+        pending: dict[Future, tuple[int, SeparatedTrack, Future | None]] = {}
+
+        # Spawned rather than forked: the workers start while the separation
+        # and I/O threads are running, and a fork would copy locks they hold
+        spawn = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=spawn) as pool:
+            for input_path, output_path, source_tags, lyrics, separated in tracks:
+                # Finish the edits that completed while this track was separated
+                self._reap_edits(pending, results, timeout=0)
+                i = len(results)
+                results.append(None)
+                try:
+                    if isinstance(separated, Exception):
+                        raise separated
+                    track = None
+                    if separated is not None:
+                        work_dir, stems = separated
+                        track = self._scan_stems(
+                            input_path, output_path, work_dir, stems, lyrics=lyrics
+                        )
+                except Exception as e:
+                    results[i] = FilterResult(
+                        input_path=input_path,
+                        output_path=output_path,
+                        profanities_found=[],
+                        transcribed_words=[],
+                        success=False,
+                        error=str(e),
+                    )
+                    continue
+
+                if track is None or not track.profanities:
+                    if track is not None:
+                        print("\nNo profanity detected - nothing to do.")
+                        if not self.keep_temp_files:
+                            _async_rmtree(track.work_dir)
+                    results[i] = FilterResult(
+                        input_path=input_path,
+                        output_path=None,
+                        profanities_found=[],
+                        transcribed_words=track.words if track else [],
+                        success=True,
+                    )
+                    continue
+
+                track.profanities, track.skipped = _split_audible(track.profanities)
+                if not track.profanities:
+                    if not self.keep_temp_files:
+                        _async_rmtree(track.work_dir)
+                    try:
+                        self._copy_unedited(input_path, output_path, track.words, source_tags)
+                    except Exception as e:
+                        results[i] = FilterResult(
+                            input_path=input_path,
+                            output_path=output_path,
+                            profanities_found=[],
+                            transcribed_words=[],
+                            success=False,
+                            error=str(e),
+                        )
+                        continue
+                    results[i] = FilterResult(
+                        input_path=input_path,
+                        output_path=output_path,
+                        profanities_found=[],
+                        transcribed_words=track.words,
+                        success=True,
+                        profanities_skipped=track.skipped,
+                    )
+                    continue
+
+                print(f"\nQueued {len(track.profanities)} profanities for muting...")
+                future = pool.submit(
+                    _edit_and_combine, track, self.editor.fade_ms, encoder_preset
+                )
+                if not self.keep_temp_files:
+                    # Free the stems as soon as the edit is done with them, so
+                    # disk use doesn't grow with the batch
+                    future.add_done_callback(
+                        lambda _future, work_dir=track.work_dir: _async_rmtree(work_dir)
+                    )
+                pending[future] = (i, track, source_tags)
+
+            self._reap_edits(pending, results)
+
+        return results
+
+    def _reap_edits(
+        self,
+        pending: dict[Future, tuple[int, SeparatedTrack, Future | None]],
+        results: list[FilterResult | None],
+        timeout: float | None = None,
+    ) -> None:
+        """
+        Finish the queued edits that have completed.
+
+        Args:
+            pending: Edit futures mapped to (result index, track, source tags
+                     future). Finished entries are removed.
+            results: Results to fill in, by index
+            timeout: Seconds to wait. 0 only collects edits that are already
+                     done; None waits for all of them.
+        """
+        done, _ = wait(pending, timeout=timeout)
+        for future in done:
+            i, track, source_tags = pending.pop(future)
+            try:
+                future.result()
+                results[i] = self._finish_track(track, source_tags)
+            except Exception as e:
+                results[i] = FilterResult(
+                    input_path=track.input_path,
+                    output_path=track.output_path,
+                    profanities_found=[],
+                    transcribed_words=[],
+                    success=False,
+                    error=str(e),
+                )
+
+    def filter_batch(
+        self,
+        input_paths: list[Path | str],
+        output_dir: Path | None = None,
+        overwrite: bool = False,
+        lyrics_for: Callable[[Path], str | None] | None = None,
+        max_workers: int | None = None,
+        encoder_preset: str | None = None,
+    ) -> list[FilterResult]:
+        """
+        Filter several tracks, separating the next track while this one is transcribed.
+
+        Separation runs on a producer thread that keeps the Demucs model
+        resident and stays up to BATCH_QUEUE_SIZE tracks ahead. Transcription
+        and detection consume its stems on this thread, so the two heaviest
+        stages overlap instead of alternating. Muting, recombining and
+        encoding are handed to a process pool.
+
+        Args:
+            input_paths: Paths to the input audio files
+            output_dir: Directory for cleaned files. If None, writes alongside inputs.
+            overwrite: If True and output_dir is None, overwrites the original files
+            lyrics_for: Optional callback returning reference lyrics for a track.
+                        Called for every track on this thread before processing
+                        starts, so its output doesn't interleave with the rest.
+            max_workers: Editing processes. Defaults to half the CPU count.
+            encoder_preset: MP3 encoder speed/quality preset (fast, medium, high).
+
+        Returns:
+            List of FilterResult objects, in the same order as input_paths
+        """
+        input_paths = [Path(p) for p in input_paths]
+        lyrics: list[str | None | Exception] = []
+        for input_path in input_paths:
+            try:
+                lyrics.append(lyrics_for(input_path) if lyrics_for else None)
+            except Exception as e:
+                lyrics.append(e)
+
+        # Resolve components shared by both threads before either uses them
+        self.separator
+        self.detector
+
+        separated: queue.Queue = queue.Queue(maxsize=BATCH_QUEUE_SIZE)
+        failure: list[Exception] = []
+
+        def produce() -> None:
+            try:
+                for track in self._prepare_tracks(input_paths, output_dir, overwrite, lyrics):
+                    separated.put(track)
+            except Exception as e:
+                failure.append(e)
+            finally:
+                separated.put(None)
+
+        # A daemon, so an interrupted consumer doesn't leave exit blocked on a full queue
+        producer = threading.Thread(target=produce, name="separation", daemon=True)
+        producer.start()
+        # The producer has finished once its closing None arrives
+        results = self._filter_tracks(iter(separated.get, None), max_workers, encoder_preset)
+
+        # If the producer stopped early, fail every track it never got to
+        error = str(failure[0]) if failure else "Track was not processed"
+        for input_path in input_paths[len(results):]:
+            results.append(
+                FilterResult(
+                    input_path=input_path,
+                    output_path=None,
+                    profanities_found=[],
+                    transcribed_words=[],
+                    success=False,
+                    error=error,
+                )
+            )
+        return results
 
     def generate_edl(
         self,
@@ -262,6 +966,11 @@ class MusicProfanityFilter:
 
         This allows users to review/edit timestamps before applying the filter.
 
+        If lyrics are given, the prescreen finds only a few profanities and a
+        "{input}.lrc" sidecar exists, edit points are estimated from the LRC
+        line timings instead, skipping separation and transcription. No stems
+        are saved in that case.
+
         Args:
             input_path: Path to the input audio file
             edl_path: Path for the EDL file. If None, uses "{input}.edl.json"
@@ -293,7 +1002,6 @@ class MusicProfanityFilter:
             stems_dir = input_path.parent / f"{input_path.stem}_stems"
         else:
             stems_dir = Path(stems_dir)
-        stems_dir.mkdir(parents=True, exist_ok=True)
 
         # Early check for profanity in lyrics
         if lyrics:
@@ -311,17 +1019,39 @@ class MusicProfanityFilter:
             print(f"Found potential profanity: {', '.join(profanity_in_lyrics)}")
             step_offset = 1
             total_steps = 4
+
+            # Few hits and synced lyrics on disk: their timings are close enough
+            # for a reviewable EDL
+            lrc_path = input_path.with_suffix(".lrc")
+            if len(profanity_in_lyrics) > LRC_FAST_PATH_MAX_HITS or not lrc_path.exists():
+                lrc_path = None
         else:
             step_offset = 0
             total_steps = 3
+            lrc_path = None
 
         try:
+            if lrc_path is not None:
+                try:
+                    result = self._generate_edl_from_lrc(input_path, lrc_path, edl_path)
+                except (OSError, ValueError) as e:
+                    print(f"Could not read {lrc_path.name} ({e}) - falling back to full analysis.")
+                else:
+                    if result is not None:
+                        return result
+                    print("No profanity located in LRC timings - falling back to full analysis.")
+
             # Separate stems
             print(f"\n[{step_offset + 1}/{total_steps}] Separating stems...")
-            stems = self.separator.separate(input_path, output_dir=stems_dir)
+            stems_dir.mkdir(parents=True, exist_ok=True)
+            self._start_warmup()
+            stems = self.separator.separate(
+                input_path, output_dir=stems_dir, fast_mode=self.fast_mode
+            )
 
             # Transcribe
             print(f"\n[{step_offset + 2}/{total_steps}] Transcribing vocals...")
+            self._wait_for_warmup()
             if lyrics:
                 words = self.transcriber.transcribe_with_context(stems["vocals"], lyrics)
             else:
@@ -334,7 +1064,7 @@ class MusicProfanityFilter:
             if not profanities:
                 print("\nNo profanity detected - nothing to do.")
                 # Clean up stems if no profanity
-                shutil.rmtree(stems_dir)
+                _async_rmtree(stems_dir)
                 return FilterResult(
                     input_path=input_path,
                     output_path=None,
@@ -373,12 +1103,69 @@ class MusicProfanityFilter:
                 error=str(e),
             )
 
+    def _generate_edl_from_lrc(
+        self, input_path: Path, lrc_path: Path, edl_path: Path
+    ) -> FilterResult | None:
+        """
+        Build an EDL from LRC line timings, without touching the audio.
+
+        Each line's words are spread evenly from its time tag towards the next
+        line's, so the edit points are estimates meant for review.
+
+        Returns:
+            FilterResult for the saved EDL, or None if no profanity was located
+        """
+        print(f"\nEstimating edit points from {lrc_path.name}...")
+        lines = parse_lrc(lrc_path)
+        next_starts = [start for start, _text in lines[1:]] + [None]
+
+        words = []
+        for (start, text), next_start in zip(lines, next_starts):
+            tokens = text.split()
+            if not tokens:
+                continue
+            end = start + len(tokens) * _LRC_MAX_WORD_SECONDS
+            if next_start is not None:
+                end = min(end, next_start)
+            step = (end - start) / len(tokens)
+            for i, token in enumerate(tokens):
+                words.append(
+                    TranscribedWord(
+                        word=token,
+                        start=start + i * step,
+                        end=start + (i + 1) * step,
+                        confidence=0.5,  # Estimated, like interpolated alignment
+                    )
+                )
+
+        profanities = self.detector.detect(words)
+        if not profanities:
+            return None
+
+        edl = create_edl(input_path, profanities)
+        edl.save(edl_path)
+
+        print(f"\nEDL generated with {len(profanities)} edit points (from LRC timings).")
+        print(f"  EDL file: {edl_path}")
+        print("\nReview the EDL file, adjust timestamps if needed, then run:")
+        print(f"  music-clean {input_path.name} --apply-edl {edl_path.name}")
+
+        return FilterResult(
+            input_path=input_path,
+            output_path=None,
+            profanities_found=profanities,
+            transcribed_words=words,
+            success=True,
+            edl_path=edl_path,
+        )
+
     def apply_edl(
         self,
         input_path: Path | str,
         edl_path: Path | str,
         output_path: Path | str | None = None,
         overwrite: bool = False,
+        encoder_preset: str | None = None,
     ) -> FilterResult:
         """
         Apply edits from an EDL file to create a cleaned track.
@@ -390,6 +1177,7 @@ class MusicProfanityFilter:
             edl_path: Path to the EDL file
             output_path: Path for the cleaned output. If None, creates "(clean)" version.
             overwrite: If True, overwrites the original file
+            encoder_preset: MP3 encoder speed/quality preset (fast, medium, high).
 
         Returns:
             FilterResult with details about the operation
@@ -422,13 +1210,16 @@ class MusicProfanityFilter:
             if overwrite:
                 output_path = input_path
             else:
-                output_path = input_path.parent / f"{input_path.stem} (clean){input_path.suffix}"
+                output_path = input_path.with_name(_clean_name(input_path))
         else:
             output_path = Path(output_path)
 
+        # Only created if the cached stems are missing and we have to separate
+        work_dir = None
+
         try:
             # Load EDL
-            print(f"\n[1/3] Loading EDL from {edl_path.name}...")
+            print(f"\n[1/2] Loading EDL from {edl_path.name}...")
             edl = EDL.load(edl_path)
 
             if not edl.edits:
@@ -446,22 +1237,32 @@ class MusicProfanityFilter:
             vocals_path = None
             instrumentals_path = None
 
-            if stems_dir and stems_dir.exists():
-                # Look for vocals and instrumentals in stems directory
-                possible_vocals = list(stems_dir.glob("**/vocals.wav"))
-                possible_instrumentals = list(stems_dir.glob("**/no_vocals.wav"))
+            # Fast mode applies the edits to the original mix, so needs no stems
+            if stems_dir and stems_dir.exists() and not self.fast_mode:
+                # Stems written with the current model live at a known path
+                stems = find_stems(stems_dir / self.separator.model / input_path.stem)
+                if stems is None:
+                    # Fall back to searching, e.g. for EDLs made with another model
+                    stems = next(
+                        (
+                            found
+                            for candidate in stems_dir.glob("**/vocals.*")
+                            if (found := find_stems(candidate.parent))
+                        ),
+                        None,
+                    )
+                if stems is not None:
+                    vocals_path = stems["vocals"]
+                    instrumentals_path = stems["instrumentals"]
 
-                if possible_vocals and possible_instrumentals:
-                    vocals_path = possible_vocals[0]
-                    instrumentals_path = possible_instrumentals[0]
+                if vocals_path is not None:
                     print(f"  Re-using stems from: {stems_dir}")
 
             # If no stems found, we need to separate again
-            temp_dir = None
-            if vocals_path is None:
-                print(f"\n[1/3] Separating stems (no cached stems found)...")
-                temp_dir = Path(tempfile.mkdtemp(prefix="music_filter_"))
-                stems = self.separator.separate(input_path, output_dir=temp_dir)
+            if vocals_path is None and not self.fast_mode:
+                print(f"\n[1/2] Separating stems (no cached stems found)...")
+                work_dir = Path(tempfile.mkdtemp(prefix="music_filter_"))
+                stems = self.separator.separate(input_path, output_dir=work_dir)
                 vocals_path = stems["vocals"]
                 instrumentals_path = stems["instrumentals"]
 
@@ -477,21 +1278,26 @@ class MusicProfanityFilter:
                 for e in edl.edits
             ]
 
-            # Mute profanities
-            print(f"\n[2/3] Muting {len(edits_for_muting)} edit points in vocals...")
-            edit_temp_dir = temp_dir or Path(tempfile.mkdtemp(prefix="music_filter_edit_"))
-            edited_vocals_path = edit_temp_dir / "edited_vocals.wav"
-            self.editor.mute_profanities(vocals_path, edits_for_muting, edited_vocals_path)
-
-            # Combine and export
-            print(f"\n[3/3] Combining stems and exporting...")
-            output_format = output_path.suffix.lstrip(".") or "mp3"
-            self.editor.combine_stems(
-                edited_vocals_path,
-                instrumentals_path,
-                output_path,
-                output_format=output_format,
-            )
+            # Mute the edit points and recombine in a single pass
+            print(f"\n[2/2] Muting {len(edits_for_muting)} edit points and exporting...")
+            output_format = _output_format(output_path)
+            if self.fast_mode:
+                self.editor.mute_profanities_on_original(
+                    input_path,
+                    edits_for_muting,
+                    output_path,
+                    output_format=output_format,
+                    encoder_preset=encoder_preset,
+                )
+            else:
+                self.editor.mute_and_combine(
+                    vocals_path,
+                    instrumentals_path,
+                    edits_for_muting,
+                    output_path,
+                    output_format=output_format,
+                    encoder_preset=encoder_preset,
+                )
 
             # Copy metadata
             print(f"\nCopying metadata...")
@@ -522,5 +1328,5 @@ class MusicProfanityFilter:
 
         finally:
             # Cleanup temp files (but not cached stems)
-            if temp_dir and temp_dir.exists() and not self.keep_temp_files:
-                shutil.rmtree(temp_dir)
+            if work_dir is not None and not self.keep_temp_files:
+                _async_rmtree(work_dir)
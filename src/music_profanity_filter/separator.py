@@ -4,35 +4,99 @@ Stem separation module using Demucs.
 Separates audio into vocals and instrumentals for targeted editing.
 """
 
+import os
 import subprocess
 import tempfile
 from pathlib import Path
 
-from tqdm import tqdm
+from .device import pick_device
+
+# Suffixes separate() may have written stems with, current format first
+_STEM_SUFFIXES = (".flac", ".wav")
+
+
+def find_stems(stem_dir: Path) -> dict[str, Path] | None:
+    """
+    Locate previously separated stems in a track's stem directory.
+
+    Args:
+        stem_dir: Directory holding one track's stems
+
+    Returns:
+        Dict with 'vocals' and 'instrumentals' paths, or None if either is missing
+    """
+    for suffix in _STEM_SUFFIXES:
+        vocals_path = stem_dir / f"vocals{suffix}"
+        instrumentals_path = stem_dir / f"no_vocals{suffix}"
+        if vocals_path.exists() and instrumentals_path.exists():
+            return {"vocals": vocals_path, "instrumentals": instrumentals_path}
+    return None
 
 
 class StemSeparator:
     """Separates audio tracks into vocal and instrumental stems using Demucs."""
 
-    def __init__(self, model: str = "htdemucs"):
+    def __init__(self, model: str = "htdemucs", device: str | None = None):
         """
         Initialize the stem separator.
 
         Args:
             model: Demucs model to use. Options: htdemucs, htdemucs_ft, mdx_extra
+            device: Torch device to run Demucs on (cpu, cuda, mps). If None,
+                   uses the best available accelerator.
         """
         self.model = model
-
-    def separate(self, audio_path: Path, output_dir: Path | None = None) -> dict[str, Path]:
+        self.device = device if device is not None else pick_device()
+        self._model = None
+
+    def _get_model(self):
+        """Lazy-load the Demucs model, keeping it resident between tracks."""
+        if self._model is None:
+            from demucs.pretrained import get_model
+
+            print(f"Loading Demucs {self.model} model...")
+            model = get_model(self.model)
+            model.to(self.device)
+            model.eval()
+            self._model = model
+        return self._model
+
+    def _load_audio(self, audio_path: Path, model):
+        """Decode a track to a (channels, samples) tensor at the model's rate."""
+        from demucs.audio import AudioFile, convert_audio
+
+        try:
+            return AudioFile(audio_path).read(
+                streams=0,
+                samplerate=model.samplerate,
+                channels=model.audio_channels,
+            )
+        except (FileNotFoundError, subprocess.CalledProcessError):
+            # ffmpeg missing or unable to read the file; torchaudio may still manage
+            import torchaudio
+
+            try:
+                wav, sample_rate = torchaudio.load(str(audio_path))
+            except RuntimeError as e:
+                raise RuntimeError(f"Demucs failed: could not load {audio_path}: {e}")
+            return convert_audio(wav, sample_rate, model.samplerate, model.audio_channels)
+
+    def separate(
+        self, audio_path: Path, output_dir: Path | None = None, fast_mode: bool = False
+    ) -> dict[str, Path]:
         """
         Separate an audio file into stems.
 
         Args:
             audio_path: Path to the input audio file
             output_dir: Directory to save stems. If None, uses a temp directory.
+            fast_mode: If True, write only the vocals, skipping the sum and
+                      encode of the instrumentals stem. Separation itself
+                      runs at the model's native rate either way.
 
         Returns:
-            Dictionary with 'vocals' and 'instrumentals' paths
+            Dictionary with 'vocals' and 'instrumentals' paths ('vocals' only
+            in fast mode)
         """
         audio_path = Path(audio_path)
         if not audio_path.exists():
@@ -44,38 +108,57 @@ class StemSeparator:
             output_dir = Path(output_dir)
             output_dir.mkdir(parents=True, exist_ok=True)
 
-        print(f"Separating stems using {self.model}...")
-
-        # Run demucs
-        cmd = [
-            "python", "-m", "demucs",
-            "--two-stems", "vocals",  # Only separate vocals vs rest
-            "-n", self.model,
-            "-o", str(output_dir),
-            str(audio_path),
-        ]
-
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-        )
-
-        if result.returncode != 0:
-            raise RuntimeError(f"Demucs failed: {result.stderr}")
-
-        # Demucs outputs to: output_dir/model_name/track_name/{vocals,no_vocals}.wav
+        print(f"Separating stems using {self.model} on {self.device}...")
+
+        # Imported here so loading the module doesn't pull in torch
+        import torch
+        from demucs.apply import apply_model
+        from demucs.audio import save_audio
+
+        model = self._get_model()
+        wav = self._load_audio(audio_path, model)
+
+        # Normalize the mix the same way the demucs CLI does
+        ref = wav.mean(0)
+        wav -= ref.mean()
+        wav /= ref.std()
+        with torch.inference_mode():
+            sources = apply_model(
+                model,
+                wav[None],
+                device=self.device,
+                shifts=1,
+                split=True,
+                overlap=0.25,
+                progress=False,
+                # Without a GPU, split the work across all cores
+                num_workers=(os.cpu_count() or 1) if self.device == "cpu" else 0,
+            )[0]
+        sources *= ref.std()
+        sources += ref.mean()
+
+        # Same layout as the demucs CLI: output_dir/model_name/track_name/{vocals,no_vocals}.flac
         stem_dir = output_dir / self.model / audio_path.stem
+        stem_dir.mkdir(parents=True, exist_ok=True)
+
+        # 16-bit FLAC is lossless but roughly half the size of WAV, and both
+        # ffmpeg and pydub decode it directly for the editing step
+        vocals_index = model.sources.index("vocals")
+        vocals_path = stem_dir / "vocals.flac"
+        save_audio(
+            sources[vocals_index], str(vocals_path), samplerate=model.samplerate, bits_per_sample=16
+        )
+        stems = {"vocals": vocals_path}
 
-        vocals_path = stem_dir / "vocals.wav"
-        instrumentals_path = stem_dir / "no_vocals.wav"
-
-        if not vocals_path.exists() or not instrumentals_path.exists():
-            raise RuntimeError(f"Expected stem files not found in {stem_dir}")
+        if not fast_mode:
+            # Second stem: everything else summed
+            no_vocals = sum(source for i, source in enumerate(sources) if i != vocals_index)
+            instrumentals_path = stem_dir / "no_vocals.flac"
+            save_audio(
+                no_vocals, str(instrumentals_path), samplerate=model.samplerate, bits_per_sample=16
+            )
+            stems["instrumentals"] = instrumentals_path
 
         print(f"Stems saved to {stem_dir}")
 
-        return {
-            "vocals": vocals_path,
-            "instrumentals": instrumentals_path,
-        }
+        return stems
@@ -0,0 +1,75 @@
+"""Tests that every alignment tier produces usable opcodes."""
+
+import random
+
+import numpy as np
+import pytest
+
+from music_profanity_filter import alignment
+from music_profanity_filter.alignment import _edit_ops, _opcodes_from_ops, align_words
+
+VOCABULARY = ["oh", "baby", "yeah", "the", "night", "is", "young", "la"]
+
+
+def _word_lists(count: int = 50):
+    rng = random.Random(0)
+    for _ in range(count):
+        source = rng.choices(VOCABULARY, k=rng.randint(0, 20))
+        target = rng.choices(VOCABULARY, k=rng.randint(0, 20))
+        yield source, target
+
+
+def _assert_valid(opcodes, source, target):
+    """Opcodes must tile both sequences and only mark truly equal blocks as equal."""
+    i = j = 0
+    for tag, i1, i2, j1, j2 in opcodes:
+        assert (i1, j1) == (i, j)
+        if tag == "equal":
+            assert source[i1:i2] == target[j1:j2]
+        elif tag == "replace":
+            assert i2 > i1 and j2 > j1
+        elif tag == "delete":
+            assert i2 > i1 and j2 == j1
+        else:
+            assert tag == "insert" and i2 == i1 and j2 > j1
+        i, j = i2, j2
+    assert (i, j) == (len(source), len(target))
+
+
+def _cost(opcodes) -> int:
+    """Levenshtein cost of a minimal opcode list."""
+    return sum(max(i2 - i1, j2 - j1) for tag, i1, i2, j1, j2 in opcodes if tag != "equal")
+
+
+def _numba_tier(source, target):
+    ids: dict[str, int] = {}
+    source_ids = np.array([ids.setdefault(w, len(ids)) for w in source], dtype=np.int32)
+    target_ids = np.array([ids.setdefault(w, len(ids)) for w in target], dtype=np.int32)
+    return _opcodes_from_ops(_edit_ops(source_ids, target_ids).tolist())
+
+
+@pytest.mark.parametrize("rapidfuzz, numba", [(True, False), (False, True), (False, False)])
+def test_align_words_tiers_are_valid(monkeypatch, rapidfuzz, numba):
+    if rapidfuzz and not alignment.RAPIDFUZZ_AVAILABLE:
+        pytest.skip("rapidfuzz not installed")
+    monkeypatch.setattr(alignment, "RAPIDFUZZ_AVAILABLE", rapidfuzz)
+    monkeypatch.setattr(alignment, "NUMBA_AVAILABLE", numba)
+
+    for source, target in _word_lists():
+        _assert_valid(align_words(source, target), source, target)
+
+
+def test_align_words_rapidfuzz_is_minimal():
+    Levenshtein = pytest.importorskip("rapidfuzz.distance").Levenshtein
+
+    for source, target in _word_lists():
+        assert _cost(align_words(source, target)) == Levenshtein.distance(source, target)
+
+
+def test_edit_ops_matches_rapidfuzz_distance():
+    Levenshtein = pytest.importorskip("rapidfuzz.distance").Levenshtein
+
+    for source, target in _word_lists():
+        opcodes = _numba_tier(source, target)
+        _assert_valid(opcodes, source, target)
+        assert _cost(opcodes) == Levenshtein.distance(source, target)
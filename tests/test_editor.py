@@ -0,0 +1,78 @@
+"""Tests for the pydub muting fallback."""
+
+import re
+
+import numpy as np
+import pytest
+from pydub import AudioSegment
+
+from music_profanity_filter import editor as editor_module
+from music_profanity_filter.editor import AudioEditor
+
+SAMPLE_RATE = 1000
+AMPLITUDE = 1000
+
+
+def _tone(seconds: float) -> AudioSegment:
+    """A constant mono 16-bit signal, so any attenuated sample stands out."""
+    samples = np.full(int(seconds * SAMPLE_RATE), AMPLITUDE, dtype=np.int16)
+    return AudioSegment(samples.tobytes(), sample_width=2, frame_rate=SAMPLE_RATE, channels=1)
+
+
+def _samples(audio: AudioSegment) -> np.ndarray:
+    return np.frombuffer(audio.raw_data, dtype=np.int16)
+
+
+def _ffmpeg_ranges(editor: AudioEditor, sections) -> list[tuple[float, float]]:
+    """The (start, end) seconds each between() term of _mute_filter covers."""
+    terms = re.findall(r"between\(t,([\d.]+),([\d.]+)\)", editor._mute_filter(sections))
+    return [(float(start), float(end)) for start, end in terms]
+
+
+@pytest.mark.parametrize(
+    "sections",
+    [
+        [(0.5, 0.6)],
+        [(0.2, 0.25), (0.7, 0.9)],
+        [(0.005, 0.1)],  # Padding clamped at the start of the audio
+    ],
+)
+def test_mute_segment_silences_ffmpeg_range(sections):
+    editor = AudioEditor(fade_ms=10)
+    fade = editor.fade_ms * SAMPLE_RATE // 1000
+    samples = _samples(editor._mute_segment(_tone(1.0), sections))
+    times = np.arange(len(samples)) / SAMPLE_RATE
+
+    touched = np.zeros(len(samples), dtype=bool)
+    for start, end in _ffmpeg_ranges(editor, sections):
+        inside = (times >= start) & (times < end)
+        assert not samples[inside].any()
+        # Fades stay within fade_ms of the muted range
+        first = int(round(start * SAMPLE_RATE))
+        last = int(round(end * SAMPLE_RATE))
+        touched[max(0, first - fade):last + fade] = True
+
+    assert (samples[~touched] == AMPLITUDE).all()
+
+
+def test_mute_segment_without_sections_returns_audio():
+    audio = _tone(0.1)
+    assert AudioEditor()._mute_segment(audio, []) is audio
+
+
+def test_combine_stems_falls_back_to_pydub_when_ffmpeg_rejects_the_mix(tmp_path, monkeypatch):
+    def old_ffmpeg(args):
+        raise RuntimeError("ffmpeg failed: Option 'normalize' not found")
+
+    monkeypatch.setattr(editor_module, "FFMPEG_AVAILABLE", True)
+    monkeypatch.setattr(editor_module, "_run_ffmpeg", old_ffmpeg)
+    vocals_path = tmp_path / "vocals.wav"
+    instrumentals_path = tmp_path / "no_vocals.wav"
+    _tone(0.5).export(str(vocals_path), format="wav")
+    _tone(0.5).export(str(instrumentals_path), format="wav")
+
+    output_path = AudioEditor().combine_stems(
+        vocals_path, instrumentals_path, tmp_path / "out.wav", output_format="wav"
+    )
+
+    assert (_samples(AudioSegment.from_file(str(output_path))) == 2 * AMPLITUDE).all()
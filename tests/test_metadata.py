@@ -0,0 +1,28 @@
+"""Tests for tag and lyrics file handling."""
+
+from music_profanity_filter.metadata import parse_lrc
+
+
+def test_parse_lrc_skips_bom(tmp_path):
+    lrc_path = tmp_path / "song.lrc"
+    lrc_path.write_bytes(b"\xef\xbb\xbf[00:01.00]First line\n[00:02.50]Second line\n")
+
+    assert parse_lrc(lrc_path) == [(1.0, "First line"), (2.5, "Second line")]
+
+
+def test_parse_lrc_reads_legacy_encoding(tmp_path):
+    lrc_path = tmp_path / "song.lrc"
+    lrc_path.write_bytes("[ar:Artist]\n[00:03.00]Café au lait\n".encode("latin-1"))
+
+    lines = parse_lrc(lrc_path)
+
+    assert [start for start, _ in lines] == [3.0]
+    assert lines[0][1].startswith("Caf")
+    assert lines[0][1].endswith(" au lait")
+
+
+def test_parse_lrc_repeats_multi_tag_lines(tmp_path):
+    lrc_path = tmp_path / "song.lrc"
+    lrc_path.write_text("[00:10.00][00:01.00]Chorus\n[00:05.00]Verse\n", encoding="utf-8")
+
+    assert parse_lrc(lrc_path) == [(1.0, "Chorus"), (5.0, "Verse"), (10.0, "Chorus")]
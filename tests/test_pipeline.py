@@ -0,0 +1,122 @@
+"""Tests for the filter pipeline's file handling."""
+
+import csv
+import json
+import tempfile
+import wave
+
+from mutagen.id3 import ID3, TIT2, TPE1
+
+from music_profanity_filter.pipeline import MusicProfanityFilter
+
+
+def test_generate_edl_uses_lrc_timings(tmp_path):
+    input_path = tmp_path / "song.mp3"
+    input_path.write_bytes(b"\x00" * 1024)
+    # BOM in front of the first time tag, which holds the only profanity
+    (tmp_path / "song.lrc").write_bytes(
+        "\ufeff[00:01.00]oh fuck this\n[00:04.00]nothing to see\n".encode("utf-8")
+    )
+
+    with MusicProfanityFilter() as profanity_filter:
+        result = profanity_filter.generate_edl(input_path, lyrics="oh fuck this nothing to see")
+
+    assert result.success, result.error
+    assert result.stems_dir is None  # Never separated
+    assert [p.word for p in result.profanities_found] == ["fuck"]
+    assert 1.0 < result.profanities_found[0].start < 4.0
+    assert json.loads(result.edl_path.read_text(encoding="utf-8"))
+
+
+def _tagged_file(path, title):
+    path.write_bytes(b"\x00" * 1024)
+    tags = ID3()
+    tags.add(TIT2(encoding=3, text=title))
+    tags.add(TPE1(encoding=3, text="Artist"))
+    tags.save(path)
+    return path
+
+
+def test_copy_unedited_marks_title_clean_and_logs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    input_path = _tagged_file(tmp_path / "song.mp3", "Song")
+    output_path = tmp_path / "out" / "song (clean).mp3"
+
+    with MusicProfanityFilter() as profanity_filter:
+        profanity_filter._copy_unedited(input_path, output_path, [])
+
+    assert str(ID3(output_path)["TIT2"]) == "Song (clean)"
+    assert str(ID3(output_path)["TPE1"]) == "Artist"
+    assert str(ID3(input_path)["TIT2"]) == "Song"
+    with open(tmp_path / "profanity_edits.log.csv", newline="", encoding="utf-8") as f:
+        assert list(csv.reader(f)) == [["timestamp", "artist", "title", "start", "end", "word"]]
+
+
+def test_copy_unedited_in_place_keeps_single_clean_suffix(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = _tagged_file(tmp_path / "song.mp3", "Song (clean)")
+
+    with MusicProfanityFilter() as profanity_filter:
+        profanity_filter._copy_unedited(path, path, [])
+
+    assert str(ID3(path)["TIT2"]) == "Song (clean)"
+
+
+def test_copy_unedited_transcodes_other_formats(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    input_path = tmp_path / "song.wav"
+    with wave.open(str(input_path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(8000)
+        f.writeframes(b"\x00\x00" * 800)
+    output_path = tmp_path / "song (clean).mp3"
+    calls = []
+
+    def mute_sections(audio_path, sections, output_path=None):
+        calls.append((audio_path, sections, output_path))
+        output_path.write_bytes(b"encoded")
+        return output_path
+
+    with MusicProfanityFilter() as profanity_filter:
+        monkeypatch.setattr(profanity_filter.editor, "mute_sections", mute_sections)
+        profanity_filter._copy_unedited(input_path, output_path, [])
+
+    assert calls == [(input_path, [], output_path)]
+
+
+def test_filter_reports_warmup_failure(tmp_path, monkeypatch):
+    scratch = tmp_path / "scratch"
+    scratch.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(scratch))
+    input_path = tmp_path / "song.mp3"
+    input_path.write_bytes(b"\x00" * 1024)
+
+    def fail():
+        raise RuntimeError("no CUDA device")
+
+    with MusicProfanityFilter() as profanity_filter:
+        monkeypatch.setattr(profanity_filter, "_start_warmup", fail)
+        result = profanity_filter.filter(input_path)
+
+    assert not result.success
+    assert result.error == "no CUDA device"
+    assert not any(p.name.startswith("music_filter_") for p in scratch.iterdir())
+
+
+def test_filter_batch_fails_tracks_the_producer_never_reached(tmp_path, monkeypatch):
+    input_paths = [tmp_path / "one.mp3", tmp_path / "two.mp3"]
+
+    def prepare_tracks(input_paths, output_dir, overwrite, lyrics):
+        # Nothing to do for the first track, then a failure outside the per-track handling
+        yield input_paths[0], None, None, None, None
+        raise RuntimeError("separator crashed")
+
+    with MusicProfanityFilter() as profanity_filter:
+        monkeypatch.setattr(profanity_filter, "_prepare_tracks", prepare_tracks)
+        results = profanity_filter.filter_batch(input_paths)
+
+    assert [r.input_path for r in results] == input_paths
+    assert results[0].success
+    assert not results[1].success
+    assert results[1].error == "separator crashed"